@@ -65,7 +65,28 @@ class Settings:
         self.ADMIN_NOTIFICATION_EMAIL: str = os.getenv("ADMIN_NOTIFICATION_EMAIL", "admin@fincenclear.com")
         self.COO_NOTIFICATION_EMAIL: str = os.getenv("COO_NOTIFICATION_EMAIL", "")  # Optional
         self.FRONTEND_URL: str = os.getenv("FRONTEND_URL", "https://fincenclear.com")
-        
+
+        # ═══════════════════════════════════════════════════════════════════════
+        # SendGrid Configuration (Transactional Email)
+        # ═══════════════════════════════════════════════════════════════════════
+        self.SENDGRID_API_KEY: str = os.getenv("SENDGRID_API_KEY", "")
+        self.SENDGRID_FROM_EMAIL: str = os.getenv("SENDGRID_FROM_EMAIL", "clear@fincenclear.com")
+        self.SENDGRID_FROM_NAME: str = os.getenv("SENDGRID_FROM_NAME", "FinClear")
+        self.SENDGRID_ENABLED: bool = os.getenv("SENDGRID_ENABLED", "false").lower() == "true"
+        # Sandbox mode: SendGrid validates requests but delivers nothing (load tests, staging)
+        self.SENDGRID_SANDBOX_MODE: bool = os.getenv("SENDGRID_SANDBOX_MODE", "false").lower() == "true"
+        # Render emails even when sending is disabled (debugging only)
+        self.LOG_EMAIL_PREVIEW: bool = os.getenv("LOG_EMAIL_PREVIEW", "false").lower() == "true"
+        # Async fan-out cap: SendGrid requests in flight at once per process
+        self.SENDGRID_MAX_CONCURRENCY: int = int(os.getenv("SENDGRID_MAX_CONCURRENCY", "16"))
+        # Send a text/plain part alongside the HTML (false lets SendGrid derive it)
+        self.INCLUDE_PLAINTEXT_BODY: bool = os.getenv("INCLUDE_PLAINTEXT_BODY", "true").lower() == "true"
+
+        # Dynamic Template IDs (optional; inline HTML is used when unset)
+        self.SENDGRID_PARTY_INVITE_TEMPLATE_ID: str = os.getenv("SENDGRID_PARTY_INVITE_TEMPLATE_ID", "")
+        self.SENDGRID_CONFIRMATION_TEMPLATE_ID: str = os.getenv("SENDGRID_CONFIRMATION_TEMPLATE_ID", "")
+        self.SENDGRID_INVOICE_TEMPLATE_ID: str = os.getenv("SENDGRID_INVOICE_TEMPLATE_ID", "")
+
         # ═══════════════════════════════════════════════════════════════════════
         # Auto-File Configuration
         # ═══════════════════════════════════════════════════════════════════════
@@ -77,6 +77,8 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("👋 Shutting down PCT FinCEN API")
+    from app.services.email_service import close_http_clients
+    close_http_clients()
 
 
 app = FastAPI(
@@ -18,13 +18,14 @@ from sqlalchemy import func
 
 from fastapi.responses import Response
 
+from app.config import get_settings
 from app.database import get_db
 from app.models.company import Company
 from app.models.user import User
 from app.models.invoice import Invoice
 from app.models.billing_event import BillingEvent
 from app.services.audit import log_event, log_change
-from app.services.email_service import send_invoice_email, SENDGRID_ENABLED, FRONTEND_URL
+from app.services.email_service import send_invoice_email
 from app.services.pdf_service import generate_invoice_pdf
 
 router = APIRouter(prefix="/billing", tags=["billing"])
@@ -877,7 +878,8 @@ async def send_invoice_email_endpoint(
         return "N/A"
     
     # Build view link
-    view_link = f"{FRONTEND_URL}/app/billing"
+    settings = get_settings()
+    view_link = f"{settings.FRONTEND_URL}/app/billing"
     
     # Send email
     result = send_invoice_email(
@@ -923,7 +925,7 @@ async def send_invoice_email_endpoint(
             "message": f"Invoice emailed to {to_email}",
             "message_id": result.message_id,
             "status": invoice.status,
-            "sendgrid_enabled": SENDGRID_ENABLED,
+            "sendgrid_enabled": settings.SENDGRID_ENABLED,
         }
     else:
         raise HTTPException(
@@ -21,7 +21,7 @@ from app.models import Report, FilingSubmission
 from app.services.demo_seed import reset_demo_data, seed_demo_data
 from app.services.notifications import list_notifications, delete_all_notifications
 from app.services.filing_lifecycle import set_demo_outcome, get_or_create_submission
-from app.services.email_service import send_party_invite, SENDGRID_ENABLED, FRONTEND_URL
+from app.services.email_service import send_party_invite
 
 
 class SetFilingOutcomeRequest(BaseModel):
@@ -305,16 +305,16 @@ async def demo_test_email(
         party_name="Test User",
         party_role="buyer",
         property_address="123 Test Street, Demo City, CA 90210",
-        portal_link=f"{FRONTEND_URL}/p/demo-test-token",
+        portal_link=f"{settings.FRONTEND_URL}/p/demo-test-token",
         company_name="Pacific Coast Title Company",
     )
     
     return {
         "ok": result.success,
-        "sendgrid_enabled": SENDGRID_ENABLED,
+        "sendgrid_enabled": settings.SENDGRID_ENABLED,
         "to_email": test_email,
         "message_id": result.message_id,
         "error": result.error,
-        "note": "Email disabled - only logging" if not SENDGRID_ENABLED else "Email sent via SendGrid",
+        "note": "Email disabled - only logging" if not settings.SENDGRID_ENABLED else "Email sent via SendGrid",
         "timestamp": datetime.utcnow().isoformat(),
     }
@@ -9,6 +9,7 @@ from pydantic import BaseModel, EmailStr
 from typing import Optional
 from datetime import datetime, timedelta
 from collections import defaultdict
+import html
 import logging
 
 from app.services.email_service import send_email, BRAND_NAME
@@ -34,12 +35,19 @@ class InquiryRequest(BaseModel):
 def get_inquiry_notification_html(inquiry: InquiryRequest) -> str:
     """Generate HTML email for team notification."""
     
+    # Public form input: escape each field once before it goes into the markup
+    name = html.escape(inquiry.name)
+    email = html.escape(inquiry.email)
+    company = html.escape(inquiry.company)
+    phone = html.escape(inquiry.phone or '—')
+    volume = html.escape(inquiry.monthly_transactions or '—')
+    
     message_section = ""
     if inquiry.message:
         message_section = f"""
             <div style="margin-top: 16px; padding: 16px; background: #f8fafc; border-radius: 6px;">
                 <p style="color: #64748b; font-size: 13px; margin: 0 0 4px;">Message</p>
-                <p style="font-size: 14px; margin: 0; white-space: pre-wrap;">{inquiry.message}</p>
+                <p style="font-size: 14px; margin: 0; white-space: pre-wrap;">{html.escape(inquiry.message)}</p>
             </div>
         """
     
@@ -52,34 +60,34 @@ def get_inquiry_notification_html(inquiry: InquiryRequest) -> str:
             <table style="width: 100%; border-collapse: collapse;">
                 <tr>
                     <td style="padding: 8px 0; color: #64748b; font-size: 14px; width: 160px;">Name</td>
-                    <td style="padding: 8px 0; font-size: 14px; font-weight: 600;">{inquiry.name}</td>
+                    <td style="padding: 8px 0; font-size: 14px; font-weight: 600;">{name}</td>
                 </tr>
                 <tr>
                     <td style="padding: 8px 0; color: #64748b; font-size: 14px;">Email</td>
                     <td style="padding: 8px 0; font-size: 14px;">
-                        <a href="mailto:{inquiry.email}" style="color: #2563eb;">{inquiry.email}</a>
+                        <a href="mailto:{email}" style="color: #2563eb;">{email}</a>
                     </td>
                 </tr>
                 <tr>
                     <td style="padding: 8px 0; color: #64748b; font-size: 14px;">Company</td>
-                    <td style="padding: 8px 0; font-size: 14px; font-weight: 600;">{inquiry.company}</td>
+                    <td style="padding: 8px 0; font-size: 14px; font-weight: 600;">{company}</td>
                 </tr>
                 <tr>
                     <td style="padding: 8px 0; color: #64748b; font-size: 14px;">Phone</td>
-                    <td style="padding: 8px 0; font-size: 14px;">{inquiry.phone or '—'}</td>
+                    <td style="padding: 8px 0; font-size: 14px;">{phone}</td>
                 </tr>
                 <tr>
                     <td style="padding: 8px 0; color: #64748b; font-size: 14px;">Est. Monthly Volume</td>
-                    <td style="padding: 8px 0; font-size: 14px;">{inquiry.monthly_transactions or '—'}</td>
+                    <td style="padding: 8px 0; font-size: 14px;">{volume}</td>
                 </tr>
             </table>
             
             {message_section}
             
             <div style="margin-top: 24px; padding-top: 16px; border-top: 1px solid #e2e8f0;">
-                <a href="mailto:{inquiry.email}?subject=Re: FinClear Inquiry from {inquiry.company}" 
+                <a href="mailto:{email}?subject=Re: FinClear Inquiry from {company}" 
                    style="display: inline-block; background: #2563eb; color: white; padding: 10px 20px; border-radius: 6px; text-decoration: none; font-size: 14px; font-weight: 500;">
-                    Reply to {inquiry.name.split()[0]}
+                    Reply to {name.split()[0] if name.split() else name}
                 </a>
             </div>
         </div>
@@ -110,7 +118,7 @@ Reply to this inquiry: mailto:{inquiry.email}
 def get_inquiry_confirmation_html(inquiry: InquiryRequest) -> str:
     """Generate HTML confirmation email for the inquirer."""
     
-    first_name = inquiry.name.split()[0] if inquiry.name else "there"
+    first_name = html.escape(inquiry.name.split()[0]) if inquiry.name.split() else "there"
     
     return f"""
     <div style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; max-width: 600px; margin: 0 auto;">
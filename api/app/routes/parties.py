@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 from typing import Optional
 import secrets
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -44,7 +44,6 @@ def _send_party_submitted_notifications(
     Uses the report's notification_config to determine what to send.
     """
     from app.config import get_settings
-    from app.services.email_service import FRONTEND_URL
     from app.models import User
     
     settings = get_settings()
@@ -58,22 +57,14 @@ def _send_party_submitted_notifications(
     
     # All party-submitted notifications are officer/staff-facing → use FinClear branding (no R2 logo needed)
     
+    # (label, email) per recipient — they all get the same email, sent as one batch
+    recipients = []
+    
     # 1. Notify the escrow officer who initiated the report
     if config.get("notify_initiator", True) and report.initiated_by_user_id:
         initiator = db.query(User).filter(User.id == report.initiated_by_user_id).first()
         if initiator and initiator.email:
-            try:
-                send_party_submitted_notification(
-                    staff_email=initiator.email,
-                    party_name=party_name,
-                    party_role=party_role,
-                    property_address=property_address,
-                    report_id=str(report.id),
-                    all_complete=all_complete,
-                )
-                logger.info(f"[PARTY_NOTIFY] Sent to initiator: {initiator.email}")
-            except Exception as e:
-                logger.warning(f"[PARTY_NOTIFY] Failed to notify initiator: {e}")
+            recipients.append(("initiator", initiator.email))
     
     # 2. Notify company admin (if different from initiator)
     if config.get("notify_company_admin", True) and report.company_id:
@@ -86,18 +77,7 @@ def _send_party_submitted_notifications(
         if company_admin and company_admin.email:
             # Don't double-notify if admin is the initiator
             if not report.initiated_by_user_id or company_admin.id != report.initiated_by_user_id:
-                try:
-                    send_party_submitted_notification(
-                        staff_email=company_admin.email,
-                        party_name=party_name,
-                        party_role=party_role,
-                        property_address=property_address,
-                        report_id=str(report.id),
-                        all_complete=all_complete,
-                    )
-                    logger.info(f"[PARTY_NOTIFY] Sent to company admin: {company_admin.email}")
-                except Exception as e:
-                    logger.warning(f"[PARTY_NOTIFY] Failed to notify company admin: {e}")
+                recipients.append(("company admin", company_admin.email))
     
     # 3. Notify staff (always notify on "all complete")
     if config.get("notify_staff", True) and settings.STAFF_NOTIFICATION_EMAIL:
@@ -105,18 +85,25 @@ def _send_party_submitted_notifications(
         should_notify_staff = all_complete or config.get("notify_on_party_submit", False)
         
         if should_notify_staff:
-            try:
-                send_party_submitted_notification(
-                    staff_email=settings.STAFF_NOTIFICATION_EMAIL,
-                    party_name=party_name,
-                    party_role=party_role,
-                    property_address=property_address,
-                    report_id=str(report.id),
-                    all_complete=all_complete,
-                )
-                logger.info(f"[PARTY_NOTIFY] Sent to staff: {settings.STAFF_NOTIFICATION_EMAIL}")
-            except Exception as e:
-                logger.warning(f"[PARTY_NOTIFY] Failed to notify staff: {e}")
+            recipients.append(("staff", settings.STAFF_NOTIFICATION_EMAIL))
+    
+    if recipients:
+        try:
+            results = send_party_submitted_notification(
+                staff_emails=[email for _, email in recipients],
+                party_name=party_name,
+                party_role=party_role,
+                property_address=property_address,
+                report_id=str(report.id),
+                all_complete=all_complete,
+            )
+            for (label, email), result in zip(recipients, results):
+                if result.success:
+                    logger.info(f"[PARTY_NOTIFY] Sent to {label}: {email}")
+                else:
+                    logger.warning(f"[PARTY_NOTIFY] Failed to notify {label}: {result.error}")
+        except Exception as e:
+            logger.warning(f"[PARTY_NOTIFY] Failed to send party submitted notifications: {e}")
     
     # 4. Log notification event (for audit trail)
     log_notification(
@@ -293,6 +280,7 @@ def save_party_data(
 def submit_party_data(
     token: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """Submit party data (final submission, locks the link)."""
@@ -366,6 +354,7 @@ def submit_party_data(
             party_name=party.display_name or "",
             confirmation_id=confirmation_id,
             property_address=property_address,
+            background_tasks=background_tasks,
         )
     else:
         # Log notification event without sending (no email)
@@ -897,7 +886,6 @@ def _send_resend_invite_email(
     Fetches company branding and calls the standard invite notification flow.
     """
     from app.services.notifications import send_party_invite_notification
-    from app.services.email_service import FRONTEND_URL
     
     # Fetch company branding
     company_name_for_email = "FinClear Solutions"
@@ -12,7 +12,7 @@ from datetime import date, datetime, timedelta
 from typing import Optional, Dict
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, Header, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Header, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
@@ -43,9 +43,9 @@ from app.schemas.common import ReadyCheckResponse, FileResponse, MissingItem
 from app.services.filing import MockFilingProvider
 import logging
 logger = logging.getLogger(__name__)
-from app.services.notifications import log_notification, send_party_invite_notification
+from app.services.notifications import log_notification, send_party_invite_notifications
 from app.services.audit import log_event
-from app.services.email_service import FRONTEND_URL, send_exempt_notification, send_links_sent_confirmation
+from app.services.email_service import send_exempt_notification, send_links_sent_confirmation
 from app.services.filing_lifecycle import (
     enqueue_submission,
     perform_mock_submit,
@@ -278,7 +278,7 @@ def list_reports_with_parties(
                 status=party.status,
                 submitted_at=party.updated_at if party.status == "submitted" else None,
                 token=active_link.token if active_link else None,
-                link=f"{FRONTEND_URL}/p/{active_link.token}" if active_link else None,
+                link=f"{settings.FRONTEND_URL}/p/{active_link.token}" if active_link else None,
                 link_expires_at=active_link.expires_at if active_link else None,
                 created_at=party.created_at,
                 completion_percentage=summary["completion_percentage"],
@@ -566,7 +566,7 @@ def get_report_parties(
         token = None
         if active_link:
             token = active_link.token
-            portal_link = f"{FRONTEND_URL}/p/{active_link.token}"
+            portal_link = f"{settings.FRONTEND_URL}/p/{active_link.token}"
             link_expires_at = active_link.expires_at
         
         # Get submitted_at from link
@@ -903,6 +903,7 @@ def create_party_links(
     report_id: UUID,
     party_links_in: PartyLinkCreate,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """Create parties and their collection links."""
@@ -919,6 +920,7 @@ def create_party_links(
         )
     
     links_created = []
+    invites = []
     expires_at = datetime.utcnow() + timedelta(days=party_links_in.expires_in_days)
     property_address = report.property_address_text or "Property"
     
@@ -979,25 +981,20 @@ def create_party_links(
         db.flush()  # Get link token
         
         # Build full URL - use FRONTEND_URL for party portal
-        portal_base = FRONTEND_URL.rstrip("/")
+        portal_base = settings.FRONTEND_URL.rstrip("/")
         link_url = f"{portal_base}/p/{link.token}"
         
-        # Send invitation email if email provided
+        # Queue invitation email if email provided (sent together below)
         email_sent = False
         if party_in.email:
-            send_party_invite_notification(
-                db=db,
-                report_id=report.id,
-                party_id=party.id,
-                party_token=link.token,
-                to_email=party_in.email,
-                party_name=party_in.display_name or "",
-                party_role=party_in.party_role,
-                property_address=property_address,
-                portal_link=link_url,
-                company_name=company_name_for_email,
-                company_logo_url=company_logo_url_for_email,
-            )
+            invites.append({
+                "party_id": party.id,
+                "party_token": link.token,
+                "to_email": party_in.email,
+                "party_name": party_in.display_name or "",
+                "party_role": party_in.party_role,
+                "portal_link": link_url,
+            })
             email_sent = True
         else:
             # Log notification event without sending (no email provided)
@@ -1030,6 +1027,17 @@ def create_party_links(
             email_sent=email_sent,
         ))
     
+    # One outbox record per party, one SendGrid request for all of them
+    send_party_invite_notifications(
+        db=db,
+        report_id=report.id,
+        invites=invites,
+        property_address=property_address,
+        company_name=company_name_for_email,
+        company_logo_url=company_logo_url_for_email,
+        background_tasks=background_tasks,
+    )
+    
     # Update report status
     report.status = "collecting"
     report.updated_at = datetime.utcnow()
@@ -1064,7 +1072,7 @@ def create_party_links(
                     for lc in links_created
                 ]
                 
-                report_url = f"{FRONTEND_URL}/app/reports/{report.id}/wizard?step=party-status"
+                report_url = f"{settings.FRONTEND_URL}/app/reports/{report.id}/wizard?step=party-status"
                 
                 # Officer-facing email — uses FinClear branding (logo_mode="finclear")
                 send_links_sent_confirmation(
@@ -1824,7 +1832,9 @@ async def download_certificate_by_token(
 
 class BulkResendResponse(BaseModel):
     message: str
-    emails_sent: int
+    # Invites scheduled for delivery after the response; each one's outcome
+    # is recorded on its NotificationEvent row, not reported here
+    emails_queued: int
     parties_skipped: int
 
 
@@ -1832,6 +1842,7 @@ class BulkResendResponse(BaseModel):
 def bulk_resend_party_links(
     report_id: UUID,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
@@ -1858,8 +1869,9 @@ def bulk_resend_party_links(
     ).all()
 
     now = datetime.utcnow()
-    emails_sent = 0
+    emails_queued = 0
     parties_skipped = 0
+    invites = []
 
     # Fetch company info for branded emails (party-facing)
     company_name = None
@@ -1914,29 +1926,30 @@ def bulk_resend_party_links(
             db.flush()
             link_url = f"{portal_base}/p/{token}"
 
-        # Send email
-        try:
-            property_address = report.property_address_text or "Property address pending"
-            party_name = party.display_name or ""
-            party_role = party.party_role or "party"
+        invites.append({
+            "party_id": party.id,
+            "party_token": token,
+            "to_email": party_email,
+            "party_name": party.display_name or "",
+            "party_role": party.party_role or "party",
+            "portal_link": link_url,
+        })
 
-            send_party_invite_notification(
-                db=db,
-                report_id=report.id,
-                party_id=party.id,
-                party_token=token,
-                to_email=party_email,
-                party_name=party_name,
-                party_role=party_role,
-                property_address=property_address,
-                portal_link=link_url,
-                company_name=company_name,
-                company_logo_url=company_logo_url,
-            )
-            emails_sent += 1
-        except Exception as e:
-            logger.warning(f"[BULK_RESEND] Email failed for party {party.id}: {e}")
-            parties_skipped += 1
+    # Queue all invites together; they are sent after the response
+    try:
+        send_party_invite_notifications(
+            db=db,
+            report_id=report.id,
+            invites=invites,
+            property_address=report.property_address_text or "Property address pending",
+            company_name=company_name,
+            company_logo_url=company_logo_url,
+            background_tasks=background_tasks,
+        )
+        emails_queued = len(invites)
+    except Exception as e:
+        logger.warning(f"[BULK_RESEND] Email failed for report {report.id}: {e}")
+        parties_skipped += len(invites)
 
     # Audit log
     try:
@@ -1951,7 +1964,7 @@ def bulk_resend_party_links(
         actor_type="client",
         action="party_links.bulk_resent",
         details={
-            "emails_sent": emails_sent,
+            "emails_queued": emails_queued,
             "parties_skipped": parties_skipped,
         },
         ip_address=client_ip,
@@ -1960,7 +1973,7 @@ def bulk_resend_party_links(
     db.commit()
 
     return BulkResendResponse(
-        message=f"Portal links resent to {emails_sent} parties",
-        emails_sent=emails_sent,
+        message=f"Portal links queued for {emails_queued} parties",
+        emails_queued=emails_queued,
         parties_skipped=parties_skipped,
     )
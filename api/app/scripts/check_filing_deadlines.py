@@ -11,6 +11,7 @@ import sys
 import os
 import logging
 from datetime import datetime, timedelta
+from html import escape
 
 # Ensure app root is on path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -62,10 +63,10 @@ def send_deadline_reminder(
         </div>
         
         <div style="padding: 24px; border: 1px solid #e5e7eb; border-top: none; border-radius: 0 0 12px 12px;">
-            <p style="color: #374151; font-size: 16px;">Hi {recipient_name},</p>
+            <p style="color: #374151; font-size: 16px;">Hi {escape(recipient_name)},</p>
             
             <p style="color: #374151;">Your FinCEN Real Estate Report for 
-               <strong>{property_address}</strong> 
+               <strong>{escape(property_address)}</strong> 
                is due in <strong>{days_until} day{'s' if days_until != 1 else ''}</strong>.</p>
             
             <div style="background: {'#fef2f2' if days_until <= 3 else '#fffbeb'}; 
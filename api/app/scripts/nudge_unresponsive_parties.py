@@ -7,6 +7,7 @@ Sends a friendly reminder email to parties whose portal links
 have been active for more than 7 days without submission.
 """
 
+import asyncio
 import sys
 import os
 import logging
@@ -21,7 +22,7 @@ from app.models.report import Report
 from app.models.party import ReportParty
 from app.models.party_link import PartyLink
 from app.models.notification_event import NotificationEvent
-from app.services.email_service import send_party_nudge
+from app.services.email_service import send_party_nudges_bulk
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
@@ -42,11 +43,46 @@ def get_property_address(report: Report) -> str:
         return "Unknown Property"
 
 
+def send_report_nudges(nudges: list) -> list:
+    """Send one report's nudges as a single bulk request."""
+    shared = nudges[0][1]
+    return send_party_nudges_bulk(
+        [kwargs for _, kwargs in nudges],
+        property_address=shared["property_address"],
+        company_name=shared["company_name"],
+        company_logo_url=shared["company_logo_url"],
+    )
+
+
+async def send_nudges(nudges: list) -> list:
+    """
+    Send nudges with one request per report, reports concurrently.
+
+    Returns one result (or exception) per nudge, in input order.
+    """
+    by_report = {}
+    for nudge in nudges:
+        by_report.setdefault(nudge[0].report_id, []).append(nudge)
+    groups = list(by_report.values())
+
+    group_results = await asyncio.gather(
+        *(asyncio.to_thread(send_report_nudges, group) for group in groups),
+        return_exceptions=True,
+    )
+
+    results = {}
+    for group, group_result in zip(groups, group_results):
+        for i, (party, _) in enumerate(group):
+            results[party.id] = group_result if isinstance(group_result, Exception) else group_result[i]
+    return [results[party.id] for party, _ in nudges]
+
+
 def nudge_parties(db: Session) -> int:
     """Find unresponsive parties and send nudge emails."""
     now = datetime.utcnow()
     cutoff = now - timedelta(days=NUDGE_AFTER_DAYS)
     nudges_sent = 0
+    nudges = []  # (party, nudge fields)
 
     # Find parties that:
     # 1. Status is NOT "submitted" or "verified"
@@ -119,43 +155,49 @@ def nudge_parties(db: Session) -> int:
             except Exception as e:
                 logger.warning(f"Could not generate logo URL: {e}")
 
-        # Send nudge (party-facing — uses company branding)
-        try:
-            result = send_party_nudge(
-                to_email=party_email,
-                party_name=party.display_name or "",
-                party_role=party.party_role or "party",
-                property_address=property_address,
-                portal_url=portal_url,
-                company_logo_url=company_logo_url,
-                company_name=company_name,
-            )
-
-            # Log notification event
-            notification = NotificationEvent(
-                report_id=party.report_id,
-                party_id=party.id,
-                type="party_nudge",
-                to_email=party_email,
-                subject=f"Reminder: Your Information is Needed — {property_address}",
-                body_preview=f"Friendly reminder: we still need your information for {property_address}.",
-                delivery_status="sent" if result.success else "failed",
-                provider_message_id=result.message_id if result.success else None,
-                sent_at=datetime.utcnow() if result.success else None,
-                error_message=result.error if not result.success else None,
-                meta={
-                    "party_name": party.display_name,
-                    "party_role": party.party_role,
-                    "days_since_created": (now - party.created_at).days if party.created_at else NUDGE_AFTER_DAYS,
-                },
-            )
-            db.add(notification)
-
-            nudges_sent += 1
-            logger.info(f"Sent nudge to {party_email} for party {party.id} (report {party.report_id})")
-
-        except Exception as e:
-            logger.error(f"Failed to nudge party {party.id}: {e}")
+        # Nudge (party-facing — uses company branding); sent together below
+        nudges.append((party, dict(
+            to_email=party_email,
+            party_name=party.display_name or "",
+            party_role=party.party_role or "party",
+            property_address=property_address,
+            portal_url=portal_url,
+            company_logo_url=company_logo_url,
+            company_name=company_name,
+        )))
+
+    results = asyncio.run(send_nudges(nudges)) if nudges else []
+
+    for (party, kwargs), result in zip(nudges, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to nudge party {party.id}: {result}")
+            continue
+
+        party_email = kwargs["to_email"]
+        property_address = kwargs["property_address"]
+
+        # Log notification event
+        notification = NotificationEvent(
+            report_id=party.report_id,
+            party_id=party.id,
+            type="party_nudge",
+            to_email=party_email,
+            subject=f"Reminder: Your Information is Needed — {property_address}",
+            body_preview=f"Friendly reminder: we still need your information for {property_address}.",
+            delivery_status="sent" if result.success else "failed",
+            provider_message_id=result.message_id if result.success else None,
+            sent_at=datetime.utcnow() if result.success else None,
+            error_message=result.error if not result.success else None,
+            meta={
+                "party_name": party.display_name,
+                "party_role": party.party_role,
+                "days_since_created": (now - party.created_at).days if party.created_at else NUDGE_AFTER_DAYS,
+            },
+        )
+        db.add(notification)
+
+        nudges_sent += 1
+        logger.info(f"Sent nudge to {party_email} for party {party.id} (report {party.report_id})")
 
     db.commit()
     return nudges_sent
@@ -46,17 +46,19 @@ from app.services.email_service import (
     send_filing_submitted_notification,
     send_filing_accepted_notification,
     send_invoice_email,
-    # Config values
-    SENDGRID_ENABLED,
-    SENDGRID_API_KEY,
-    SENDGRID_FROM_EMAIL,
-    FRONTEND_URL,
 )
+from app.config import get_settings
 
 # ===================================================================
 # Configuration
 # ===================================================================
 
+settings = get_settings()
+SENDGRID_ENABLED = settings.SENDGRID_ENABLED
+SENDGRID_API_KEY = settings.SENDGRID_API_KEY
+SENDGRID_FROM_EMAIL = settings.SENDGRID_FROM_EMAIL
+FRONTEND_URL = settings.FRONTEND_URL
+
 TEST_EMAIL = "gerardoh@gmail.com"
 DELAY_SECONDS = 2  # Pause between sends to avoid rate limits
 
@@ -167,8 +169,8 @@ def send_email_3():
 
 def send_email_4():
     print("4/8  Party Submitted (officer-facing -> FinClear logo) ...")
-    result = send_party_submitted_notification(
-        staff_email=TEST_EMAIL,
+    [result] = send_party_submitted_notification(
+        staff_emails=[TEST_EMAIL],
         party_name="John Smith",
         party_role="transferee",
         property_address=PROPERTY_ADDRESS,
@@ -212,6 +214,7 @@ def send_email_6():
         to_email=TEST_EMAIL,
         recipient_name="Jennifer Walsh",
         property_address=PROPERTY_ADDRESS,
+        submitted_at_str=datetime.utcnow().strftime('%B %d, %Y at %I:%M %p'),
         report_url=MOCK_REPORT_URL,
         # Officer-facing: no company_logo_url — uses FinClear branding
     )
@@ -439,7 +439,8 @@ def test_nudge_text_fallback(verbose: bool) -> dict:
 
 def test_party_submitted(verbose: bool) -> dict:
     """Build the same HTML that send_party_submitted_notification would."""
-    from app.services.email_service import _build_email_wrapper, _text, _info_card, FRONTEND_URL
+    from app.config import get_settings
+    from app.services.email_service import _build_email_wrapper, _text, _info_card
     
     checks = []
     party_name = "Michael Chen"
@@ -452,7 +453,7 @@ def test_party_submitted(verbose: bool) -> dict:
         _text(f"<strong>{party_name}</strong> ({role_display}) has submitted their information for:")
         + _info_card("Property Address", property_address, "#2563eb")
     )
-    report_url = f"{FRONTEND_URL}/app/staff/requests/{report_id}"
+    report_url = f"{get_settings().FRONTEND_URL}/app/staff/requests/{report_id}"
     
     html = _build_email_wrapper(
         body_content=body,
@@ -478,7 +479,8 @@ def test_party_submitted(verbose: bool) -> dict:
 # ── All Parties Complete ─────────────────────────────────────────────────────
 
 def test_all_complete(verbose: bool) -> dict:
-    from app.services.email_service import _build_email_wrapper, _text, _info_card, FRONTEND_URL
+    from app.config import get_settings
+    from app.services.email_service import _build_email_wrapper, _text, _info_card
     
     checks = []
     property_address = "456 Oak Avenue, Pasadena, CA 91101"
@@ -493,7 +495,7 @@ def test_all_complete(verbose: bool) -> dict:
         body_content=body,
         header_text="All Parties Complete",
         header_subtext=property_address,
-        action_url=f"{FRONTEND_URL}/app/staff/requests/rpt-123",
+        action_url=f"{get_settings().FRONTEND_URL}/app/staff/requests/rpt-123",
         action_text="View Report",
         header_accent="green",
         logo_mode="finclear",
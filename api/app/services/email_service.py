@@ -5,10 +5,28 @@ Sends transactional emails for party invitations and confirmations.
 All emails are logged to NotificationEvent outbox first.
 """
 
-import os
+import asyncio
+import gzip
+import html
+import json
 import logging
-from typing import Optional
-from datetime import datetime
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
+from app.config import get_settings
+
+# httpx is imported where a send actually happens, so code that only
+# renders templates doesn't pay for it.
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -17,13 +35,48 @@ BRAND_NAME = "FinClear"
 BRAND_TAGLINE = "FinCEN Compliance Made Simple"
 BRAND_SUPPORT_EMAIL = "support@fincenclear.com"
 
-# Configuration
-SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY")
-SENDGRID_FROM_EMAIL = os.getenv("SENDGRID_FROM_EMAIL", "clear@fincenclear.com")
-SENDGRID_FROM_NAME = os.getenv("SENDGRID_FROM_NAME", BRAND_NAME)
-SENDGRID_ENABLED = os.getenv("SENDGRID_ENABLED", "false").lower() == "true"
-FRONTEND_URL = os.getenv("FRONTEND_URL", "https://fincenclear.com")
-LOGO_URL = f"{FRONTEND_URL}/logo.png"
+# Cheap shape check so obviously bad addresses never cost an API round-trip
+_EMAIL_RE = re.compile(r"^[^@\s,]+@[^@\s,]+\.[^@\s,]+\Z")
+
+# SendGrid accepts at most 1000 personalizations per request; stay well under it
+SENDGRID_MAX_PERSONALIZATIONS = 900
+
+SENDGRID_MAIL_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+
+# Transient statuses worth retrying, and the base delay between attempts
+SENDGRID_RETRY_STATUSES = (429, 502, 503, 504)
+SENDGRID_MAX_RETRIES = 3
+SENDGRID_BACKOFF_SECONDS = 0.3
+# Longest Retry-After we will honor before giving up on the attempt
+SENDGRID_MAX_RETRY_AFTER_SECONDS = 30.0
+
+# Request bodies at least this large are gzipped; the minified HTML
+# compresses several-fold, smaller bodies aren't worth the CPU
+SENDGRID_GZIP_MIN_BYTES = 1024
+
+# Async fan-out: requests started per second, across every thread and event
+# loop in the process. Requests in flight per fan-out are capped by the
+# SENDGRID_MAX_CONCURRENCY setting (see _max_concurrent_sends).
+SENDGRID_RATE_LIMIT_PER_SECOND = 100
+
+# Shared HTTP client — keeps TLS connections to SendGrid alive across sends
+_http_client: Optional["httpx.Client"] = None
+_http_client_lock = threading.Lock()
+
+# Async client and concurrency cap of the fan-out in progress, if any (see
+# _async_send_session). An AsyncClient is tied to the event loop it runs on,
+# so it lives only as long as the fan-out rather than in a module global.
+_current_async_session: ContextVar[Optional["_AsyncSendSession"]] = ContextVar(
+    "sendgrid_async_session", default=None,
+)
+
+# Recent sends made with an idempotency key, so a retried job or double-fired
+# webhook doesn't send the same message twice. Keyed by (to, idempotency key);
+# sends without a key (e.g. staff-initiated resends) always go out.
+SENDGRID_DEDUP_TTL_SECONDS = 300
+SENDGRID_DEDUP_MAX_ENTRIES = 10_000
+_sent_cache: "OrderedDict[Tuple[str, str], Tuple[EmailResult, float]]" = OrderedDict()
+_sent_cache_lock = threading.Lock()
 
 # ============================================================================
 # Design System — Color Palette
@@ -41,12 +94,12 @@ LOGO_URL = f"{FRONTEND_URL}/logo.png"
 # ============================================================================
 
 
+@dataclass(frozen=True, slots=True)
 class EmailResult:
     """Result of an email send attempt."""
-    def __init__(self, success: bool, message_id: Optional[str] = None, error: Optional[str] = None):
-        self.success = success
-        self.message_id = message_id
-        self.error = error
+    success: bool
+    message_id: Optional[str] = None
+    error: Optional[str] = None
     
     def to_dict(self):
         return {
@@ -56,64 +109,711 @@ class EmailResult:
         }
 
 
+class SendGridError(Exception):
+    """SendGrid rejected a request."""
+    def __init__(self, message: str, status_code: int = None):
+        self.message = message
+        self.status_code = status_code
+        super().__init__(message)
+
+
+class _RateLimiter:
+    """
+    Process-wide limit of `rate` requests per second, with bursts of up to
+    `rate`. Callers reserve the next free slot and sleep until it comes up;
+    the lock is only held to reserve, so one limiter serves every thread
+    and event loop.
+    """
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.interval = 1.0 / rate
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Claim the next request slot; returns the seconds to wait for it."""
+        with self.lock:
+            now = time.monotonic()
+            # An idle limiter has banked at most `rate` slots
+            slot = max(self.next_slot, now - 1.0 + self.interval)
+            self.next_slot = slot + self.interval
+            return max(0.0, slot - now)
+
+
+_send_rate_limiter = _RateLimiter(SENDGRID_RATE_LIMIT_PER_SECOND)
+
+
+@dataclass(slots=True)
+class _AsyncSendSession:
+    """The async client and in-flight cap shared by the sends of one fan-out."""
+    client: "httpx.AsyncClient"
+    semaphore: asyncio.Semaphore
+
+
+def _get_recent_send(key: Tuple[str, str]) -> Optional[EmailResult]:
+    """Return the result of a send with this key within the dedup window, if any."""
+    with _sent_cache_lock:
+        entry = _sent_cache.get(key)
+        if entry is None:
+            return None
+        result, sent_at = entry
+        if time.monotonic() - sent_at > SENDGRID_DEDUP_TTL_SECONDS:
+            del _sent_cache[key]
+            return None
+        return result
+
+
+def _remember_send(key: Tuple[str, str], result: EmailResult) -> None:
+    with _sent_cache_lock:
+        _sent_cache[key] = (result, time.monotonic())
+        _sent_cache.move_to_end(key)
+        while len(_sent_cache) > SENDGRID_DEDUP_MAX_ENTRIES:
+            _sent_cache.popitem(last=False)
+
+
+def _get_http_client() -> "httpx.Client":
+    """Return the process-wide pooled HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                import httpx
+                _http_client = httpx.Client(
+                    transport=httpx.HTTPTransport(retries=SENDGRID_MAX_RETRIES),
+                    # Report-level fan-out (nudge cron, bulk resends) sends from
+                    # several threads at once; keep all of their connections warm
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+                    timeout=httpx.Timeout(30.0, connect=5.0),
+                )
+    return _http_client
+
+
+def _max_concurrent_sends() -> int:
+    """Async sends allowed in flight at once, from SENDGRID_MAX_CONCURRENCY (at least 1)."""
+    return max(1, get_settings().SENDGRID_MAX_CONCURRENCY)
+
+
+def _new_async_http_client(max_concurrent_sends: int) -> "httpx.AsyncClient":
+    import httpx
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(retries=SENDGRID_MAX_RETRIES),
+        # Keep a warm connection for every concurrent send slot, so a
+        # gathered batch doesn't redo TLS handshakes between waves
+        limits=httpx.Limits(
+            max_connections=max_concurrent_sends,
+            max_keepalive_connections=max_concurrent_sends,
+        ),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+    )
+
+
+@asynccontextmanager
+async def _async_send_session() -> AsyncIterator[_AsyncSendSession]:
+    """
+    The async client and in-flight cap for the current fan-out.
+    
+    send_many() opens one around its gather, and the sends inside share
+    it; a lone send_email_async() opens its own. The client is closed when
+    the session ends, so the sync paths that run a fan-out under
+    asyncio.run() don't leave a client behind on each dead loop, and
+    threads running their own loops never share one.
+    """
+    session = _current_async_session.get()
+    if session is not None:
+        yield session
+        return
+    
+    max_concurrent_sends = _max_concurrent_sends()
+    session = _AsyncSendSession(
+        client=_new_async_http_client(max_concurrent_sends),
+        semaphore=asyncio.Semaphore(max_concurrent_sends),
+    )
+    token = _current_async_session.set(session)
+    try:
+        yield session
+    finally:
+        _current_async_session.reset(token)
+        await session.client.aclose()
+
+
+def close_http_clients() -> None:
+    """Close the pooled SendGrid connections (called on app shutdown)."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+def _mail_payload(personalizations: List[Dict], **fields) -> Dict:
+    """
+    Build a v3 mail/send payload from the configured sender.
+    
+    Extra keyword fields (e.g. template_id) are added as-is; subject and
+    content are usually spliced in by _encode_payload().
+    """
+    settings = get_settings()
+    payload = {
+        "from": {"email": settings.SENDGRID_FROM_EMAIL, "name": settings.SENDGRID_FROM_NAME},
+        "personalizations": personalizations,
+        **fields,
+    }
+    if settings.SENDGRID_SANDBOX_MODE:
+        # SendGrid validates the request and returns 200 without delivering
+        payload["mail_settings"] = {"sandbox_mode": {"enable": True}}
+    return payload
+
+
+def _mail_content(html_content: str, text_content: Optional[str]) -> List[Dict]:
+    # SendGrid requires text/plain to come before text/html
+    content = [{"type": "text/html", "value": html_content}]
+    if text_content:
+        content.insert(0, {"type": "text/plain", "value": text_content})
+    return content
+
+
+@lru_cache(maxsize=256)
+def _encoded_message(subject: str, html_content: str, text_content: Optional[str]) -> bytes:
+    """
+    UTF-8 JSON for the subject and content fields of a mail/send payload.
+    
+    Cached so repeat sends of one rendered email (staff fan-out, outbox
+    batches) only encode the recipient-specific envelope each time. Kept
+    as bytes so the document is never re-encoded when spliced into a body.
+    """
+    message = {"subject": subject, "content": _mail_content(html_content, text_content)}
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":"))[1:-1].encode("utf-8")
+
+
+def _encode_payload(payload: Dict, message: Optional[bytes] = None) -> bytes:
+    """
+    Serialize a mail/send payload to a request body.
+    
+    `message` is a fragment from _encoded_message(); it is spliced into
+    the object as-is rather than encoded again.
+    """
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if message:
+        body = b"".join((body[:-1], b",", message, b"}"))
+    return body
+
+
+@lru_cache(maxsize=8)
+def _mail_send_headers(api_key: str, gzipped: bool = False) -> Dict[str, str]:
+    """Request headers for mail/send; built once per API key, not per call."""
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+    return headers
+
+
+def _mail_send_request(body: bytes) -> Tuple[bytes, Dict[str, str]]:
+    """Body and headers to POST, gzipping bodies of SENDGRID_GZIP_MIN_BYTES or more."""
+    api_key = get_settings().SENDGRID_API_KEY
+    if len(body) < SENDGRID_GZIP_MIN_BYTES:
+        return body, _mail_send_headers(api_key)
+    return gzip.compress(body), _mail_send_headers(api_key, gzipped=True)
+
+
+def _raise_for_mail_send(response: "httpx.Response") -> None:
+    if response.status_code >= 400:
+        raise SendGridError(
+            f"SendGrid returned {response.status_code}: {response.text[:200]}",
+            status_code=response.status_code,
+        )
+
+
+def _retry_delay(response: "httpx.Response", attempt: int) -> float:
+    """
+    Seconds to wait before retrying a transient failure.
+    
+    Exponential backoff, stretched to SendGrid's Retry-After when it asks
+    for longer (capped at SENDGRID_MAX_RETRY_AFTER_SECONDS).
+    """
+    delay = SENDGRID_BACKOFF_SECONDS * (2 ** attempt)
+    try:
+        retry_after = float(response.headers.get("Retry-After", 0))
+    except ValueError:
+        retry_after = 0.0
+    return max(delay, min(retry_after, SENDGRID_MAX_RETRY_AFTER_SECONDS))
+
+
+def _post_mail_send(body: bytes) -> "httpx.Response":
+    """
+    POST an encoded payload to the SendGrid v3 mail/send endpoint.
+    
+    Connection failures are retried by the transport; 429 and 5xx gateway
+    responses are retried here with exponential backoff, honoring
+    Retry-After. Raises SendGridError if SendGrid still rejects the request.
+    """
+    body, headers = _mail_send_request(body)
+    
+    for attempt in range(SENDGRID_MAX_RETRIES + 1):
+        response = _get_http_client().post(SENDGRID_MAIL_SEND_URL, content=body, headers=headers)
+        if response.status_code not in SENDGRID_RETRY_STATUSES or attempt == SENDGRID_MAX_RETRIES:
+            break
+        time.sleep(_retry_delay(response, attempt))
+    
+    _raise_for_mail_send(response)
+    return response
+
+
+async def _post_mail_send_async(body: bytes) -> "httpx.Response":
+    """
+    Async counterpart of _post_mail_send, with the same retry behavior.
+    
+    Each attempt waits for a slot under SENDGRID_MAX_CONCURRENCY and
+    SENDGRID_RATE_LIMIT_PER_SECOND, so a large gather queues here instead
+    of tripping SendGrid's rate limit. Backoff sleeps hold neither.
+    """
+    body, headers = _mail_send_request(body)
+    
+    async with _async_send_session() as session:
+        for attempt in range(SENDGRID_MAX_RETRIES + 1):
+            async with session.semaphore:
+                await asyncio.sleep(_send_rate_limiter.reserve())
+                response = await session.client.post(SENDGRID_MAIL_SEND_URL, content=body, headers=headers)
+            if response.status_code not in SENDGRID_RETRY_STATUSES or attempt == SENDGRID_MAX_RETRIES:
+                break
+            await asyncio.sleep(_retry_delay(response, attempt))
+    
+    _raise_for_mail_send(response)
+    return response
+
+
+def _invalid_address(to_email: Optional[str]) -> Optional[EmailResult]:
+    """The invalid-address result, or None when the address looks deliverable."""
+    if to_email and _EMAIL_RE.match(to_email):
+        return None
+    logger.warning("Invalid email address: %s", to_email)
+    return EmailResult(success=False, error="Invalid email address")
+
+
+def _precheck(
+    to_email: Union[Optional[str], List[str]],
+    subject: str,
+    rendering: bool = False,
+    idempotency_key: Optional[str] = None,
+) -> Optional[EmailResult]:
+    """
+    The result for an email that won't go out, or None when it should be sent.
+    
+    Every send entry point calls this first: sending disabled, a missing
+    API key, a malformed address or, with an idempotency key, a recent send
+    under the same key (see send_email()). Bulk senders pass their list of
+    addresses; each is then checked as the recipients are chunked.
+    
+    Notification senders call it with rendering=True before building a
+    body, so nothing is rendered for an email that can't go out. The one
+    exception is LOG_EMAIL_PREVIEW, which renders bodies that the send call
+    afterwards only logs.
+    """
+    settings = get_settings()
+    if not settings.SENDGRID_ENABLED:
+        if rendering and settings.LOG_EMAIL_PREVIEW:
+            return None
+        recipients = ", ".join(to_email) if isinstance(to_email, list) else to_email
+        logger.info("[EMAIL DISABLED] Would send to %s: %s", recipients, subject)
+        return EmailResult(success=True, message_id="disabled-mode")
+    
+    if not settings.SENDGRID_API_KEY:
+        logger.error("SENDGRID_API_KEY not configured")
+        return EmailResult(success=False, error="API key not configured")
+    
+    if isinstance(to_email, list):
+        return None
+    
+    invalid = _invalid_address(to_email)
+    if invalid is not None:
+        return invalid
+    
+    if idempotency_key:
+        previous = _get_recent_send((to_email.lower(), idempotency_key))
+        if previous is not None:
+            logger.info("[EMAIL DEDUPED] to=%s key=%s message_id=%s", to_email, idempotency_key, previous.message_id)
+            return EmailResult(success=True, message_id=f"dedup-{previous.message_id}")
+    
+    return None
+
+
+def _message_id(response: "httpx.Response") -> str:
+    """SendGrid's X-Message-Id, or a unique local id if the header is missing."""
+    return response.headers.get("X-Message-Id") or f"sg-{uuid.uuid4().hex}"
+
+
+def _record_sent(
+    to_email: str,
+    label: str,
+    response: "httpx.Response",
+    idempotency_key: Optional[str] = None,
+) -> EmailResult:
+    message_id = _message_id(response)
+    
+    logger.info("[EMAIL SENT] to=%s %s message_id=%s status=%s", to_email, label, message_id, response.status_code)
+    
+    result = EmailResult(success=True, message_id=message_id)
+    if idempotency_key:
+        _remember_send((to_email.lower(), idempotency_key), result)
+    return result
+
+
+def _single_email_body(to_email: str, subject: str, html_content: str, text_content: Optional[str]) -> bytes:
+    """Request body for one recipient; the subject and content come from the _encoded_message() cache."""
+    return _encode_payload(
+        _mail_payload([{"to": [{"email": to_email}]}]),
+        _encoded_message(subject, html_content, text_content),
+    )
+
+
 def send_email(
     to_email: str,
     subject: str,
     html_content: str,
     text_content: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
 ) -> EmailResult:
     """
     Send an email via SendGrid.
     
     If SENDGRID_ENABLED is false, logs the email but doesn't send.
+    
+    Automated callers that may fire twice (retried jobs, webhooks, status
+    pollers) pass an idempotency_key naming the logical email; a second
+    send to the same recipient under that key within
+    SENDGRID_DEDUP_TTL_SECONDS is skipped. Without a key every call sends,
+    so a deliberate resend of an identical email always goes out.
     """
-    # Check if sending is disabled
-    if not SENDGRID_ENABLED:
-        logger.info(f"[EMAIL DISABLED] Would send to {to_email}: {subject}")
-        return EmailResult(success=True, message_id="disabled-mode")
+    skipped = _precheck(to_email, subject, idempotency_key=idempotency_key)
+    if skipped is not None:
+        return skipped
     
-    # Check for API key
-    if not SENDGRID_API_KEY:
-        logger.error("SENDGRID_API_KEY not configured")
-        return EmailResult(success=False, error="API key not configured")
+    try:
+        response = _post_mail_send(_single_email_body(to_email, subject, html_content, text_content))
+        return _record_sent(to_email, f"subject='{subject}'", response, idempotency_key)
+        
+    except Exception as e:
+        logger.error("[EMAIL FAILED] to=%s error=%s", to_email, e)
+        return EmailResult(success=False, error=str(e))
+
+
+async def send_email_async(
+    to_email: str,
+    subject: str,
+    html_content: str,
+    text_content: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
+) -> EmailResult:
+    """
+    Async version of send_email for callers already on the event loop.
     
-    # Check for valid recipient
-    if not to_email or "@" not in to_email:
-        logger.warning(f"Invalid email address: {to_email}")
-        return EmailResult(success=False, error="Invalid email address")
+    Same checks, idempotency and logging, but the request goes through an
+    httpx.AsyncClient, so several sends can overlap instead of blocking one
+    after another; gather them with send_many() to share one client.
+    """
+    skipped = _precheck(to_email, subject, idempotency_key=idempotency_key)
+    if skipped is not None:
+        return skipped
     
     try:
-        from sendgrid import SendGridAPIClient
-        from sendgrid.helpers.mail import Mail, Email, To, Content
-        
-        message = Mail(
-            from_email=Email(SENDGRID_FROM_EMAIL, SENDGRID_FROM_NAME),
-            to_emails=To(to_email),
-            subject=subject,
-        )
-        message.add_content(Content("text/html", html_content))
-        
-        if text_content:
-            message.add_content(Content("text/plain", text_content))
+        response = await _post_mail_send_async(_single_email_body(to_email, subject, html_content, text_content))
+        return _record_sent(to_email, f"subject='{subject}'", response, idempotency_key)
         
-        sg = SendGridAPIClient(SENDGRID_API_KEY)
-        response = sg.send(message)
-        
-        message_id = response.headers.get("X-Message-Id", f"sg-{datetime.utcnow().timestamp()}")
-        
-        logger.info(f"[EMAIL SENT] to={to_email} subject='{subject}' message_id={message_id} status={response.status_code}")
-        
-        return EmailResult(success=True, message_id=message_id)
+    except Exception as e:
+        logger.error("[EMAIL FAILED] to=%s error=%s", to_email, e)
+        return EmailResult(success=False, error=str(e))
+
+
+async def send_many(messages: List[Tuple[str, ...]]) -> List[EmailResult]:
+    """
+    Send several emails concurrently; returns results in input order.
+    
+    Each message is the positional arguments of send_email_async:
+    (to_email, subject, html_content[, text_content[, idempotency_key]]). The sends share
+    one async client, closed when they finish; concurrency and request rate
+    are bounded by the async send limits.
+    
+    Meant for code already on an event loop. Sync callers with several
+    recipients should use send_email_bulk(), which needs one request and
+    no loop, rather than wrapping this in asyncio.run().
+    """
+    async with _async_send_session():
+        return list(await asyncio.gather(*(send_email_async(*message) for message in messages)))
+
+
+async def send_rendered_many(
+    messages: List[Tuple[str, Callable[[], Tuple[str, str]]]],
+    idempotency_key: Optional[str] = None,
+) -> List[EmailResult]:
+    """
+    send_many() for messages that haven't been rendered yet.
+    
+    Each message is (to_email, render), where render() returns the
+    (subject, html) pair; the text part is derived with _plain_text_part().
+    The renderers only run once _precheck() says the emails can go out, so
+    nothing is rendered while sending is disabled.
+    """
+    if not messages:
+        return []
+    skipped = _precheck([to_email for to_email, _ in messages], "rendered notifications", rendering=True)
+    if skipped is not None:
+        return [skipped for _ in messages]
+    rendered = [(to_email, *render()) for to_email, render in messages]
+    return await send_many([
+        (to_email, subject, html_content, _plain_text_part(html_content), idempotency_key)
+        for to_email, subject, html_content in rendered
+    ])
+
+
+def send_template_email(
+    to_email: str,
+    template_id: str,
+    template_data: Dict,
+    idempotency_key: Optional[str] = None,
+) -> EmailResult:
+    """
+    Send an email rendered by a SendGrid Dynamic Template.
+    
+    Only the template ID and its substitution data go over the wire;
+    the subject and body live in the template. idempotency_key works as
+    in send_email().
+    """
+    label = f"template={template_id}"
+    skipped = _precheck(to_email, label, idempotency_key=idempotency_key)
+    if skipped is not None:
+        return skipped
+    
+    try:
+        response = _post_mail_send(_encode_payload(_mail_payload(
+            [{"to": [{"email": to_email}], "dynamic_template_data": template_data}],
+            template_id=template_id,
+        )))
+        return _record_sent(to_email, label, response, idempotency_key)
         
     except Exception as e:
-        logger.error(f"[EMAIL FAILED] to={to_email} error={str(e)}")
+        logger.error("[EMAIL FAILED] to=%s error=%s", to_email, e)
         return EmailResult(success=False, error=str(e))
 
 
+def _send_bulk(
+    recipients: List[Dict],
+    label: str,
+    personalization: Callable[[Dict], Dict],
+    message: Optional[bytes] = None,
+    **fields,
+) -> List[EmailResult]:
+    """
+    Post recipients as personalizations, SENDGRID_MAX_PERSONALIZATIONS per request.
+    
+    Shared by the bulk senders: runs _precheck() once for the batch, checks
+    each "email" address, and builds each recipient's personalization with
+    `personalization`. `message` and `fields` are passed through to
+    _encode_payload() and _mail_payload(). Returns one EmailResult per
+    recipient, in input order.
+    """
+    skipped = _precheck([recipient.get("email") for recipient in recipients], label)
+    if skipped is not None:
+        return [skipped for _ in recipients]
+    
+    results: List[Optional[EmailResult]] = [_invalid_address(recipient.get("email")) for recipient in recipients]
+    valid = [i for i, result in enumerate(results) if result is None]
+    
+    for start in range(0, len(valid), SENDGRID_MAX_PERSONALIZATIONS):
+        chunk = valid[start:start + SENDGRID_MAX_PERSONALIZATIONS]
+        try:
+            response = _post_mail_send(_encode_payload(
+                _mail_payload([personalization(recipients[i]) for i in chunk], **fields),
+                message,
+            ))
+            
+            message_id = _message_id(response)
+            
+            logger.info("[EMAIL SENT] bulk recipients=%s %s message_id=%s status=%s", len(chunk), label, message_id, response.status_code)
+            
+            result = EmailResult(success=True, message_id=message_id)
+        except Exception as e:
+            logger.error("[EMAIL FAILED] bulk recipients=%s %s error=%s", len(chunk), label, e)
+            result = EmailResult(success=False, error=str(e))
+        
+        for i in chunk:
+            results[i] = result
+    
+    return results
+
+
+def send_template_email_bulk(
+    recipients: List[Dict],
+    template_id: str,
+) -> List[EmailResult]:
+    """
+    Send a SendGrid Dynamic Template to many recipients via personalizations.
+    
+    Each recipient is a dict with an "email" key and a "template_data" dict
+    for that recipient. Recipients are sent in chunks of
+    SENDGRID_MAX_PERSONALIZATIONS, one API call per chunk.
+    
+    Returns one EmailResult per recipient, in input order.
+    """
+    return _send_bulk(
+        recipients,
+        f"template={template_id}",
+        lambda recipient: {"to": [{"email": recipient["email"]}], "dynamic_template_data": recipient["template_data"]},
+        template_id=template_id,
+    )
+
+
+def _substitution_personalization(recipient: Dict) -> Dict:
+    personalization = {"to": [{"email": recipient["email"]}]}
+    if recipient.get("substitutions"):
+        personalization["substitutions"] = recipient["substitutions"]
+    return personalization
+
+
+def send_email_bulk(
+    recipients: List[Dict],
+    subject: str,
+    html_content: str,
+    text_content: Optional[str] = None,
+) -> List[EmailResult]:
+    """
+    Send one email body to many recipients via SendGrid personalizations.
+    
+    Each recipient is a dict with an "email" key and an optional
+    "substitutions" dict mapping tokens in the body (e.g. "-party_name-")
+    to that recipient's values. Recipients are sent in chunks of
+    SENDGRID_MAX_PERSONALIZATIONS, one API call per chunk.
+    
+    Returns one EmailResult per recipient, in input order.
+    """
+    return _send_bulk(
+        recipients,
+        f"subject='{subject}'",
+        _substitution_personalization,
+        _encoded_message(subject, html_content, text_content),
+    )
+
+
 # ============================================================================
 # SHARED EMAIL WRAPPER — Consistent Design System
 # ============================================================================
 
+_INDENT_RE = re.compile(r"[ \t]*\n\s*")
+# Source-only comments; Outlook conditional comments (<!--[if ...]>) are kept
+_COMMENT_RE = re.compile(r"<!--(?!\[).*?-->", re.DOTALL)
+
+
+def _minify_html(template: str) -> str:
+    """
+    Drop source comments, indentation and blank lines from an HTML template.
+    
+    Each run of whitespace that spans a line break becomes a single newline,
+    which renders the same, so the markup is otherwise untouched. Applied
+    once at import to the prebuilt documents below.
+    """
+    return _INDENT_RE.sub("\n", _COMMENT_RE.sub("", template))
+
+
+_ACCENT_COLORS = {
+    "blue":  {"bg": "#2563eb", "bg2": "#1d4ed8"},
+    "green": {"bg": "#059669", "bg2": "#047857"},
+    "amber": {"bg": "#d97706", "bg2": "#b45309"},
+    "red":   {"bg": "#dc2626", "bg2": "#b91c1c"},
+}
+
+# FinClear logo block for officer/staff emails, one per accent color
+_FINCLEAR_LOGO_HTML = {
+    name: _minify_html(f'''
+                                <table role="presentation" cellspacing="0" cellpadding="0" style="margin:0 auto;">
+                                    <tr>
+                                        <td style="vertical-align:middle; padding-right:10px;">
+                                            <div style="width:36px; height:36px; background:{colors["bg"]}; border-radius:8px; text-align:center; line-height:36px;">
+                                                <span style="color:#ffffff; font-size:18px; font-weight:bold;">F</span>
+                                            </div>
+                                        </td>
+                                        <td style="vertical-align:middle;">
+                                            <span style="font-size:20px; font-weight:700; color:#0f172a; letter-spacing:-0.3px;">{BRAND_NAME}</span>
+                                        </td>
+                                    </tr>
+                                </table>
+''')
+    for name, colors in _ACCENT_COLORS.items()
+}
+
+# Email chrome with the brand already filled in; only the per-email slots
+# are formatted in _build_email_wrapper.
+_EMAIL_DOCUMENT_HTML = _minify_html(f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{header_text}}</title>
+</head>
+<body style="margin:0; padding:0; font-family:-apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; line-height:1.6; background-color:#f8fafc;">
+
+    <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="background-color:#f8fafc;">
+        <tr>
+            <td align="center" style="padding:40px 20px;">
+
+                <!-- Main Card -->
+                <table role="presentation" width="600" cellspacing="0" cellpadding="0" style="background-color:#ffffff; border-radius:12px; overflow:hidden; box-shadow:0 1px 3px rgba(0,0,0,0.08);">
+
+                    <!-- Logo Area -->
+                    <tr>
+                        <td style="padding:28px 40px 16px; text-align:center;">
+                            {{logo_html}}
+                        </td>
+                    </tr>
+
+                    <!-- Divider -->
+                    <tr>
+                        <td style="padding:0 40px;">
+                            <div style="border-top:1px solid #e2e8f0;"></div>
+                        </td>
+                    </tr>
+
+                    <!-- Header Text -->
+                    <tr>
+                        <td style="padding:20px 40px 8px; text-align:center;">
+                            <h1 style="margin:0; font-size:24px; font-weight:700; color:#0f172a;">
+                                {{header_text}}
+                            </h1>
+                            {{subtext_html}}
+                        </td>
+                    </tr>
+
+                    <!-- Body Content -->
+                    <tr>
+                        <td style="padding:16px 40px 32px;">
+                            {{body_content}}
+                            {{button_html}}
+                        </td>
+                    </tr>
+
+                    <!-- Footer -->
+                    <tr>
+                        <td style="background-color:#f8fafc; border-top:1px solid #e2e8f0; padding:20px 40px; text-align:center;">
+                            {{footer_note_html}}
+                            <p style="margin:0; color:#64748b; font-size:12px;">
+                                Powered by {BRAND_NAME} &middot; {BRAND_TAGLINE}
+                            </p>
+                            <p style="margin:6px 0 0; color:#94a3b8; font-size:11px;">
+                                This is an automated message. Please do not reply directly.
+                            </p>
+                        </td>
+                    </tr>
+
+                </table>
+
+            </td>
+        </tr>
+    </table>
+
+</body>
+</html>""")
+
+
 def _build_email_wrapper(
     body_content: str,
     company_logo_url: Optional[str] = None,
@@ -130,6 +830,9 @@ def _build_email_wrapper(
     """
     Build a complete HTML email with consistent branding.
 
+    Every template in this module calls this once at import with
+    {placeholder} values, so it is not on the per-send path.
+
     Args:
         body_content: The unique HTML body for this email type.
         company_logo_url: Optional pre-signed URL for company logo (only used when logo_mode="company").
@@ -143,14 +846,7 @@ def _build_email_wrapper(
         logo_mode: "finclear" (officer/staff emails) or "company" (party-facing emails).
         company_name: Fallback text when logo_mode="company" but no logo image uploaded.
     """
-    # Accent color mapping
-    accent_map = {
-        "blue":  {"bg": "#2563eb", "bg2": "#1d4ed8"},
-        "green": {"bg": "#059669", "bg2": "#047857"},
-        "amber": {"bg": "#d97706", "bg2": "#b45309"},
-        "red":   {"bg": "#dc2626", "bg2": "#b91c1c"},
-    }
-    accent = accent_map.get(header_accent, accent_map["blue"])
+    accent = _ACCENT_COLORS.get(header_accent, _ACCENT_COLORS["blue"])
     btn_bg = button_color or accent["bg"]
 
     # Logo block — determined by logo_mode
@@ -171,20 +867,7 @@ def _build_email_wrapper(
 '''
     else:
         # logo_mode == "finclear" (default) — officer/staff emails: show FinClear branding
-        logo_html = f'''
-                                <table role="presentation" cellspacing="0" cellpadding="0" style="margin:0 auto;">
-                                    <tr>
-                                        <td style="vertical-align:middle; padding-right:10px;">
-                                            <div style="width:36px; height:36px; background:{accent["bg"]}; border-radius:8px; text-align:center; line-height:36px;">
-                                                <span style="color:#ffffff; font-size:18px; font-weight:bold;">F</span>
-                                            </div>
-                                        </td>
-                                        <td style="vertical-align:middle;">
-                                            <span style="font-size:20px; font-weight:700; color:#0f172a; letter-spacing:-0.3px;">{BRAND_NAME}</span>
-                                        </td>
-                                    </tr>
-                                </table>
-'''
+        logo_html = _FINCLEAR_LOGO_HTML.get(header_accent, _FINCLEAR_LOGO_HTML["blue"])
 
     # Header subtext
     subtext_html = ""
@@ -212,97 +895,37 @@ def _build_email_wrapper(
     if footer_note:
         footer_note_html = f'<p style="margin:0 0 12px; color:#94a3b8; font-size:12px;">{footer_note}</p>'
 
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{header_text}</title>
-</head>
-<body style="margin:0; padding:0; font-family:-apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; line-height:1.6; background-color:#f8fafc;">
-
-    <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="background-color:#f8fafc;">
-        <tr>
-            <td align="center" style="padding:40px 20px;">
-
-                <!-- Main Card -->
-                <table role="presentation" width="600" cellspacing="0" cellpadding="0" style="background-color:#ffffff; border-radius:12px; overflow:hidden; box-shadow:0 1px 3px rgba(0,0,0,0.08);">
-
-                    <!-- Logo Area -->
-                    <tr>
-                        <td style="padding:28px 40px 16px; text-align:center;">
-                            {logo_html}
-                        </td>
-                    </tr>
-
-                    <!-- Divider -->
-                    <tr>
-                        <td style="padding:0 40px;">
-                            <div style="border-top:1px solid #e2e8f0;"></div>
-                        </td>
-                    </tr>
-
-                    <!-- Header Text -->
-                    <tr>
-                        <td style="padding:20px 40px 8px; text-align:center;">
-                            <h1 style="margin:0; font-size:24px; font-weight:700; color:#0f172a;">
-                                {header_text}
-                            </h1>
-                            {subtext_html}
-                        </td>
-                    </tr>
-
-                    <!-- Body Content -->
-                    <tr>
-                        <td style="padding:16px 40px 32px;">
-                            {body_content}
-                            {button_html}
-                        </td>
-                    </tr>
+    return _EMAIL_DOCUMENT_HTML.format(
+        header_text=header_text,
+        logo_html=logo_html,
+        subtext_html=subtext_html,
+        body_content=body_content,
+        button_html=button_html,
+        footer_note_html=footer_note_html,
+    )
 
-                    <!-- Footer -->
-                    <tr>
-                        <td style="background-color:#f8fafc; border-top:1px solid #e2e8f0; padding:20px 40px; text-align:center;">
-                            {footer_note_html}
-                            <p style="margin:0; color:#64748b; font-size:12px;">
-                                Powered by {BRAND_NAME} &middot; {BRAND_TAGLINE}
-                            </p>
-                            <p style="margin:6px 0 0; color:#94a3b8; font-size:11px;">
-                                This is an automated message. Please do not reply directly.
-                            </p>
-                        </td>
-                    </tr>
 
-                </table>
+# ============================================================================
+# Shared HTML helpers for body_content
+# ============================================================================
 
-            </td>
-        </tr>
-    </table>
+def _escaped(**fields) -> Dict[str, object]:
+    """HTML-escape the str values of template fields; other values pass through."""
+    return {k: html.escape(v) if isinstance(v, str) else v for k, v in fields.items()}
 
-</body>
-</html>"""
 
+# (background, text) colors for callouts, keyed by accent color
+_CARD_ACCENTS = {
+    "#2563eb": ("#eff6ff", "#1e3a8a"),   # blue
+    "#059669": ("#ecfdf5", "#065f46"),   # green
+    "#d97706": ("#fffbeb", "#92400e"),   # amber
+    "#dc2626": ("#fef2f2", "#991b1b"),   # red
+}
 
-# ============================================================================
-# Shared HTML helpers for body_content
-# ============================================================================
 
 def _info_card(label: str, value: str, accent: str = "#2563eb") -> str:
     """A styled info callout (property address, status, etc.)."""
-    bg_map = {
-        "#2563eb": "#eff6ff",   # blue
-        "#059669": "#ecfdf5",   # green
-        "#d97706": "#fffbeb",   # amber
-        "#dc2626": "#fef2f2",   # red
-    }
-    text_map = {
-        "#2563eb": "#1e3a8a",
-        "#059669": "#065f46",
-        "#d97706": "#92400e",
-        "#dc2626": "#991b1b",
-    }
-    bg = bg_map.get(accent, "#eff6ff")
-    txt = text_map.get(accent, "#1e3a8a")
+    bg, txt = _CARD_ACCENTS.get(accent, _CARD_ACCENTS["#2563eb"])
     return f'''
                             <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="margin:16px 0;">
                                 <tr>
@@ -325,13 +948,7 @@ def _detail_row(label: str, value: str, accent: str = "#065f46") -> str:
 
 def _detail_block(rows_html: str, accent: str = "#059669") -> str:
     """Wraps detail rows in a styled block."""
-    bg_map = {
-        "#059669": "#ecfdf5",
-        "#2563eb": "#eff6ff",
-        "#d97706": "#fffbeb",
-        "#dc2626": "#fef2f2",
-    }
-    bg = bg_map.get(accent, "#ecfdf5")
+    bg, _ = _CARD_ACCENTS.get(accent, _CARD_ACCENTS["#059669"])
     return f'''
                             <div style="background:{bg}; border-left:4px solid {accent}; padding:16px 20px; margin:16px 0; border-radius:0 8px 8px 0;">
                                 {rows_html}
@@ -348,54 +965,86 @@ def _muted(content: str) -> str:
     return f'<p style="margin:16px 0 0; color:#64748b; font-size:13px;">{content}</p>'
 
 
-def _warning_box(content: str) -> str:
-    """Amber warning callout."""
-    return f'''
-                            <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="margin:16px 0;">
-                                <tr>
-                                    <td style="background-color:#fffbeb; border:1px solid #fbbf24; padding:14px 18px; border-radius:8px;">
-                                        <p style="margin:0; color:#92400e; font-size:14px;">{content}</p>
-                                    </td>
-                                </tr>
-                            </table>'''
+def _warning_box(content: str) -> str:
+    """Amber warning callout."""
+    return f'''
+                            <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="margin:16px 0;">
+                                <tr>
+                                    <td style="background-color:#fffbeb; border:1px solid #fbbf24; padding:14px 18px; border-radius:8px;">
+                                        <p style="margin:0; color:#92400e; font-size:14px;">{content}</p>
+                                    </td>
+                                </tr>
+                            </table>'''
+
+
+# Display labels for ReportParty.party_role values
+_ROLE_DISPLAY = {
+    "transferee": "Transferee",
+    "transferor": "Transferor",
+    "beneficial_owner": "Beneficial Owner",
+    "reporting_person": "Reporting Person",
+}
+
+
+def _role_display(party_role: str) -> str:
+    """Human-readable label for a party role (e.g. "beneficial_owner" -> "Beneficial Owner")."""
+    return _ROLE_DISPLAY.get(party_role) or party_role.replace("_", " ").title()
+
+
+# Plain-language labels used in staff/officer emails
+_ROLE_SHORT_DISPLAY = {
+    "transferee": "Buyer",
+    "transferor": "Seller",
+}
+
+
+def _role_short_display(party_role: str) -> str:
+    """Buyer/Seller for the two sides of the transaction, else the _role_display() label."""
+    return _ROLE_SHORT_DISPLAY.get(party_role) or _role_display(party_role)
+
+
+# ============================================================================
+# Plain-text alternative derived from the rendered HTML
+# ============================================================================
+
+_HEAD_RE = re.compile(r"<head\b.*?</head>", re.IGNORECASE | re.DOTALL)
+_LINK_RE = re.compile(r'<a\b[^>]*\bhref="([^"]*)"[^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+_BLOCK_END_RE = re.compile(r"<br\s*/?>|</(?:p|div|h[1-6]|li|tr)>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+@lru_cache(maxsize=1024)
+def _html_to_text(html_content: str) -> str:
+    """
+    Convert a rendered email to its plain-text alternative.
+    
+    Links become "label: url", block elements end a line, and all other
+    markup is dropped. Cached per unique HTML since resends repeat it.
+    """
+    text = _HEAD_RE.sub("", html_content)
+    text = _LINK_RE.sub(lambda m: f"{_TAG_RE.sub('', m.group(2)).strip()}: {m.group(1)}", text)
+    text = _BLOCK_END_RE.sub("\n", text)
+    text = html.unescape(_TAG_RE.sub("", text))
+    text = "\n".join(line.strip() for line in text.splitlines())
+    return _BLANK_LINES_RE.sub("\n\n", text).strip() + "\n"
+
+
+def _plain_text_part(html_content: str) -> Optional[str]:
+    """Plain-text alternative for an email, or None when INCLUDE_PLAINTEXT_BODY is off."""
+    if not get_settings().INCLUDE_PLAINTEXT_BODY:
+        return None
+    return _html_to_text(html_content)
 
 
 # ============================================================================
 # TEMPLATE 1: Party Invite  (buyer/seller portal link)
 # ============================================================================
 
-def get_party_invite_html(
-    party_name: str,
-    party_role: str,
-    property_address: str,
-    portal_link: str,
-    company_name: Optional[str] = None,
-    company_logo_url: Optional[str] = None,
-) -> str:
-    """Generate HTML for party invitation email with optional company logo."""
-    
-    role_display = party_role.replace("_", " ").title()
-    greeting = party_name if party_name else "Property Transaction Party"
-    company_line = f" on behalf of <strong>{company_name}</strong>" if company_name else ""
+_PARTY_INVITE_SUBJECT = "Action Required: Information Needed for Real Estate Transaction"
 
-    body = (
-        _text(f"Dear {greeting},")
-        + _text(
-            f'You are receiving this email because you are listed as the '
-            f'<strong style="color:#2563eb;">{role_display}</strong> '
-            f'in a real estate transaction{company_line}.'
-        )
-        + _info_card("Property Address", property_address, "#2563eb")
-        + _text(
-            "Under federal regulations, we are required to collect certain information "
-            "from all parties involved in this transaction. This is a secure process and "
-            "your information will only be used for compliance purposes."
-        )
-        + _warning_box(
-            "<strong>Time Sensitive:</strong> Please complete this form within "
-            "<strong>7 days</strong>. The secure link will expire after that time."
-        )
-        + f'''
+# Static footer shared by every invite; it has no placeholders.
+_PARTY_INVITE_FAQ_HTML = '''
                             <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="margin:24px 0 0; border-top:1px solid #e2e8f0; padding-top:20px;">
                                 <tr>
                                     <td>
@@ -410,61 +1059,99 @@ def get_party_invite_html(
                                     </td>
                                 </tr>
                             </table>'''
+
+# Body assembled from the shared helpers once at import; only the
+# {placeholders} are filled per email.
+_PARTY_INVITE_BODY = (
+    _text("Dear {greeting},")
+    + _text(
+        'You are receiving this email because you are listed as the '
+        '<strong style="color:#2563eb;">{role_display}</strong> '
+        'in a real estate transaction{company_line}.'
     )
-    
-    return _build_email_wrapper(
-        body_content=body,
-        company_logo_url=company_logo_url,
-        header_text="Action Required",
-        header_subtext="Submit Your Transaction Information",
-        action_url=portal_link,
-        action_text="Open Secure Portal",
-        header_accent="blue",
-        logo_mode="company",
-        company_name=company_name,
+    + _info_card("Property Address", "{property_address}", "#2563eb")
+    + _text(
+        "Under federal regulations, we are required to collect certain information "
+        "from all parties involved in this transaction. This is a secure process and "
+        "your information will only be used for compliance purposes."
     )
+    + _warning_box(
+        "<strong>Time Sensitive:</strong> Please complete this form within "
+        "<strong>7 days</strong>. The secure link will expire after that time."
+    )
+    + _PARTY_INVITE_FAQ_HTML
+)
+
+
+# Full documents with the wrapper applied once at import — one variant per
+# logo block, since that is the only part of the chrome that changes.
+# Kept as str rather than pre-encoded bytes: the body is embedded in the JSON
+# request payload and has to be JSON-escaped, so byte chunks could not be
+# spliced in directly. _encoded_message() caches that encoding per body.
+_PARTY_INVITE_WRAPPER_ARGS = dict(
+    body_content=_PARTY_INVITE_BODY,
+    header_text="Action Required",
+    header_subtext="Submit Your Transaction Information",
+    action_url="{portal_link}",
+    action_text="Open Secure Portal",
+    header_accent="blue",
+    logo_mode="company",
+)
+_PARTY_INVITE_HTML_WITH_LOGO = _minify_html(_build_email_wrapper(
+    company_logo_url="{company_logo_url}",
+    **_PARTY_INVITE_WRAPPER_ARGS,
+))
+_PARTY_INVITE_HTML_WITH_NAME = _minify_html(_build_email_wrapper(
+    company_name="{company_display_name}",
+    **_PARTY_INVITE_WRAPPER_ARGS,
+))
 
 
-def get_party_invite_text(
+def get_party_invite_html(
     party_name: str,
     party_role: str,
     property_address: str,
     portal_link: str,
+    company_name: Optional[str] = None,
+    company_logo_url: Optional[str] = None,
 ) -> str:
-    """Generate plain text for party invitation email."""
+    """Generate HTML for party invitation email with optional company logo."""
     
-    role_display = party_role.replace("_", " ").title()
+    role_display = _role_display(party_role)
     greeting = party_name if party_name else "Property Transaction Party"
-    
-    return f"""
-ACTION REQUIRED — Submit Your Transaction Information
-
-Dear {greeting},
-
-You are receiving this email because you are listed as the {role_display} in a real estate transaction for:
-
-{property_address}
-
-Under federal regulations, we are required to collect certain information from all parties involved in this transaction.
-
-Please complete your information by visiting this secure link:
-{portal_link}
-
-TIME SENSITIVE: Please complete this form within 7 days.
-
----
-
-Why am I receiving this?
-The Financial Crimes Enforcement Network (FinCEN) requires reporting on certain real estate transactions to prevent money laundering.
-
-Is this legitimate?
-Yes. This request is part of the legal compliance process for your real estate transaction. If you have concerns, please contact your title company representative.
+    company_line = f" on behalf of <strong>{html.escape(company_name)}</strong>" if company_name else ""
+    template = _PARTY_INVITE_HTML_WITH_LOGO if company_logo_url else _PARTY_INVITE_HTML_WITH_NAME
+
+    return template.format(
+        company_line=company_line,
+        **_escaped(
+            greeting=greeting,
+            role_display=role_display,
+            property_address=property_address,
+            portal_link=portal_link,
+            company_logo_url=company_logo_url,
+            company_display_name=company_name or "Your Escrow Company",
+        ),
+    )
 
----
 
-This is an automated message. Please do not reply directly to this email.
-Powered by {BRAND_NAME} - {BRAND_TAGLINE}
-"""
+def get_party_invite_text(
+    party_name: str,
+    party_role: str,
+    property_address: str,
+    portal_link: str,
+    company_name: Optional[str] = None,
+    company_logo_url: Optional[str] = None,
+) -> str:
+    """Generate plain text for party invitation email."""
+    return _html_to_text(get_party_invite_html(
+        party_name=party_name,
+        party_role=party_role,
+        property_address=property_address,
+        portal_link=portal_link,
+        company_name=company_name,
+        company_logo_url=company_logo_url,
+    ))
 
 
 def send_party_invite(
@@ -475,11 +1162,26 @@ def send_party_invite(
     portal_link: str,
     company_name: Optional[str] = None,
     company_logo_url: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
 ) -> EmailResult:
     """
     Send party invitation email.
+    
+    Uses the SendGrid Dynamic Template when SENDGRID_PARTY_INVITE_TEMPLATE_ID
+    is set; otherwise renders the HTML locally. See send_email() for
+    idempotency_key.
     """
-    subject = "Action Required: Information Needed for Real Estate Transaction"
+    subject = _PARTY_INVITE_SUBJECT
+    
+    skipped = _precheck(to_email, subject, rendering=True, idempotency_key=idempotency_key)
+    if skipped is not None:
+        return skipped
+    
+    settings = get_settings()
+    if settings.SENDGRID_ENABLED and settings.SENDGRID_PARTY_INVITE_TEMPLATE_ID:
+        return send_template_email(to_email, settings.SENDGRID_PARTY_INVITE_TEMPLATE_ID, _party_invite_template_data(
+            party_name, party_role, property_address, portal_link, company_name, company_logo_url,
+        ), idempotency_key=idempotency_key)
     
     html_content = get_party_invite_html(
         party_name=party_name,
@@ -490,34 +1192,125 @@ def send_party_invite(
         company_logo_url=company_logo_url,
     )
     
-    text_content = get_party_invite_text(
-        party_name=party_name,
-        party_role=party_role,
+    text_content = _plain_text_part(html_content)
+    
+    return send_email(to_email, subject, html_content, text_content, idempotency_key)
+
+
+def _party_invite_template_data(
+    party_name: Optional[str],
+    party_role: str,
+    property_address: str,
+    portal_link: str,
+    company_name: Optional[str],
+    company_logo_url: Optional[str],
+) -> Dict:
+    """dynamic_template_data for the party invite Dynamic Template."""
+    return {
+        "subject": _PARTY_INVITE_SUBJECT,
+        "greeting": party_name or "Property Transaction Party",
+        "role_display": _role_display(party_role),
+        "property_address": property_address,
+        "portal_link": portal_link,
+        "company_name": company_name,
+        "company_logo_url": company_logo_url,
+    }
+
+
+def send_party_invites_bulk(
+    invites: List[Dict],
+    property_address: str,
+    company_name: Optional[str] = None,
+    company_logo_url: Optional[str] = None,
+) -> List[EmailResult]:
+    """
+    Send party invitations for one transaction in a single SendGrid request.
+    
+    Each invite is a dict with "to_email", "party_name", "party_role" and
+    "portal_link". With a Dynamic Template configured, each recipient gets
+    its own template data; otherwise the invite body is rendered once with
+    substitution tokens and each recipient's values are filled in by SendGrid.
+    
+    Returns one EmailResult per invite, in input order.
+    """
+    subject = _PARTY_INVITE_SUBJECT
+    
+    skipped = _precheck([invite["to_email"] for invite in invites], subject, rendering=True)
+    if skipped is not None:
+        return [skipped for _ in invites]
+    
+    settings = get_settings()
+    if settings.SENDGRID_ENABLED and settings.SENDGRID_PARTY_INVITE_TEMPLATE_ID:
+        return send_template_email_bulk([
+            {
+                "email": invite["to_email"],
+                "template_data": _party_invite_template_data(
+                    invite.get("party_name"), invite["party_role"], property_address,
+                    invite["portal_link"], company_name, company_logo_url,
+                ),
+            }
+            for invite in invites
+        ], settings.SENDGRID_PARTY_INVITE_TEMPLATE_ID)
+    
+    # Tokens are title-cased so they survive the role formatting in the renderers
+    html_content = get_party_invite_html(
+        party_name="-Greeting-",
+        party_role="-Role-",
         property_address=property_address,
-        portal_link=portal_link,
+        portal_link="-Link-",
+        company_name=company_name,
+        company_logo_url=company_logo_url,
     )
     
-    return send_email(to_email, subject, html_content, text_content)
+    text_content = _party_text_part(_plain_text_part(html_content))
+    
+    return send_email_bulk(_party_bulk_recipients(invites, "portal_link"), subject, html_content, text_content)
+
+
+# Per-party substitution tokens: HTML token -> its plain-text counterpart.
+# SendGrid substitutes into every content part, so the text part gets its own
+# tokens carrying the raw values while the HTML tokens carry escaped ones.
+_PARTY_TEXT_TOKENS = {
+    "-Greeting-": "-GreetingText-",
+    "-Role-": "-RoleText-",
+    "-Link-": "-LinkText-",
+}
+
+
+def _party_text_part(text_content: Optional[str]) -> Optional[str]:
+    """A tokenized plain-text part with its HTML tokens swapped for the text ones."""
+    if text_content is None:
+        return None
+    for html_token, text_token in _PARTY_TEXT_TOKENS.items():
+        text_content = text_content.replace(html_token, text_token)
+    return text_content
+
+
+def _party_bulk_recipients(items: List[Dict], link_key: str) -> List[Dict]:
+    """send_email_bulk recipients filling the -Greeting-/-Role-/-Link- tokens per party."""
+    recipients = []
+    for item in items:
+        values = {
+            "-Greeting-": item.get("party_name") or "Property Transaction Party",
+            "-Role-": _role_display(item["party_role"]),
+            "-Link-": item[link_key],
+        }
+        # The HTML part gets values escaped like the renderers do; the text part the raw ones
+        substitutions = _escaped(**values)
+        substitutions.update((_PARTY_TEXT_TOKENS[token], value) for token, value in values.items())
+        recipients.append({"email": item["to_email"], "substitutions": substitutions})
+    return recipients
 
 
 # ============================================================================
 # TEMPLATE 2: Submission Confirmation  (to the party who just submitted)
 # ============================================================================
 
-def get_confirmation_html(
-    party_name: str,
-    confirmation_id: str,
-    property_address: str,
-) -> str:
-    """Generate HTML for submission confirmation email."""
-    
-    greeting = party_name if party_name else "Valued Party"
-    
-    body = (
-        _text(f"Dear {greeting},")
-        + _text("We have successfully received your information for the real estate transaction at:")
-        + _info_card("Property Address", property_address, "#059669")
-        + f'''
+_CONFIRMATION_BODY = (
+    _text("Dear {greeting},")
+    + _text("We have successfully received your information for the real estate transaction at:")
+    + _info_card("Property Address", "{property_address}", "#059669")
+    + '''
                             <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="margin:20px 0;">
                                 <tr>
                                     <td style="background-color:#ecfdf5; border:2px solid #86efac; padding:24px; border-radius:12px; text-align:center;">
@@ -530,46 +1323,46 @@ def get_confirmation_html(
                                     </td>
                                 </tr>
                             </table>'''
-        + _text("<strong>Please save this confirmation ID for your records.</strong>")
-        + _muted("No further action is required from you at this time. If you have any questions about the transaction, please contact your title company representative.")
-    )
+    + _text("<strong>Please save this confirmation ID for your records.</strong>")
+    + _muted("No further action is required from you at this time. If you have any questions about the transaction, please contact your title company representative.")
+)
 
-    return _build_email_wrapper(
-        body_content=body,
-        header_text="Information Received",
-        header_subtext="Thank you for your submission",
-        header_accent="green",
-    )
 
+_CONFIRMATION_HTML = _minify_html(_build_email_wrapper(
+    body_content=_CONFIRMATION_BODY,
+    header_text="Information Received",
+    header_subtext="Thank you for your submission",
+    header_accent="green",
+))
 
-def get_confirmation_text(
+
+def get_confirmation_html(
     party_name: str,
     confirmation_id: str,
     property_address: str,
 ) -> str:
-    """Generate plain text for submission confirmation email."""
+    """Generate HTML for submission confirmation email."""
     
     greeting = party_name if party_name else "Valued Party"
     
-    return f"""
-INFORMATION RECEIVED
-
-Dear {greeting},
-
-We have successfully received your information for the real estate transaction at:
-
-{property_address}
-
-YOUR CONFIRMATION ID: {confirmation_id}
-
-Please save this confirmation ID for your records.
-
-No further action is required from you at this time. If you have any questions about the transaction, please contact your title company representative.
+    return _CONFIRMATION_HTML.format(**_escaped(
+        greeting=greeting,
+        confirmation_id=confirmation_id,
+        property_address=property_address,
+    ))
 
----
 
-Powered by {BRAND_NAME} - {BRAND_TAGLINE}
-"""
+def get_confirmation_text(
+    party_name: str,
+    confirmation_id: str,
+    property_address: str,
+) -> str:
+    """Generate plain text for submission confirmation email."""
+    return _html_to_text(get_confirmation_html(
+        party_name=party_name,
+        confirmation_id=confirmation_id,
+        property_address=property_address,
+    ))
 
 
 def send_party_confirmation(
@@ -580,20 +1373,32 @@ def send_party_confirmation(
 ) -> EmailResult:
     """
     Send submission confirmation email.
+    
+    Uses the SendGrid Dynamic Template when SENDGRID_CONFIRMATION_TEMPLATE_ID
+    is set; otherwise renders the HTML locally.
     """
     subject = "Confirmed: Your Information Has Been Received"
     
+    skipped = _precheck(to_email, subject, rendering=True)
+    if skipped is not None:
+        return skipped
+    
+    settings = get_settings()
+    if settings.SENDGRID_ENABLED and settings.SENDGRID_CONFIRMATION_TEMPLATE_ID:
+        return send_template_email(to_email, settings.SENDGRID_CONFIRMATION_TEMPLATE_ID, {
+            "subject": subject,
+            "greeting": party_name or "Valued Party",
+            "confirmation_id": confirmation_id,
+            "property_address": property_address,
+        })
+    
     html_content = get_confirmation_html(
         party_name=party_name,
         confirmation_id=confirmation_id,
         property_address=property_address,
     )
     
-    text_content = get_confirmation_text(
-        party_name=party_name,
-        confirmation_id=confirmation_id,
-        property_address=property_address,
-    )
+    text_content = _plain_text_part(html_content)
     
     return send_email(to_email, subject, html_content, text_content)
 
@@ -602,90 +1407,132 @@ def send_party_confirmation(
 # TEMPLATE 3: Party Submitted  (notify escrow officer)
 # ============================================================================
 
+_PARTY_SUBMITTED_SUBJECT = "Party Submitted: {} ({})".format
+_ALL_PARTIES_COMPLETE_SUBJECT = "All Parties Complete -- Ready for Review: {}".format
+
+_PARTY_SUBMITTED_HTML = _minify_html(_build_email_wrapper(
+    body_content=(
+        _text("<strong>{party_name}</strong> ({role_display}) has submitted their information for:")
+        + _info_card("Property Address", "{property_address}", "#2563eb")
+    ),
+    header_text="Party Submission Received",
+    header_subtext="{party_name} -- {role_display}",
+    action_url="{report_url}",
+    action_text="View Report",
+    header_accent="blue",
+    logo_mode="finclear",
+))
+
+_ALL_PARTIES_COMPLETE_HTML = _minify_html(_build_email_wrapper(
+    body_content=(
+        _text("<strong>{party_name}</strong> ({role_display}) has submitted their information for:")
+        + _info_card("Property Address", "{property_address}", "#059669")
+        + _text('<strong style="color:#059669;">All parties have now submitted. This report is ready for review and filing.</strong>')
+    ),
+    header_text="All Parties Complete",
+    header_subtext="{property_address}",
+    action_url="{report_url}",
+    action_text="View Report",
+    header_accent="green",
+    logo_mode="finclear",
+))
+
+_PARTY_SUBMITTED_TEXT_TEMPLATE = f"""
+Party Submitted: {{party_name}}
+
+{{party_name}} ({{role_display}}) has submitted their information for:
+{{property_address}}
+
+{{status_line}}
+
+View the report: {{report_url}}
+
+---
+{BRAND_NAME} - {BRAND_TAGLINE}
+"""
+
+# Drop the status line with its paragraph break so no blank lines pile up
+_PARTY_SUBMITTED_TEXT = _PARTY_SUBMITTED_TEXT_TEMPLATE.replace("{status_line}\n\n", "")
+_ALL_PARTIES_COMPLETE_TEXT = _PARTY_SUBMITTED_TEXT_TEMPLATE.replace(
+    "{status_line}", "ALL PARTIES COMPLETE -- Ready for review and filing."
+)
+
+
 def send_party_submitted_notification(
-    staff_email: str,
+    staff_emails: List[str],
     party_name: str,
     party_role: str,
     property_address: str,
     report_id: str,
     all_complete: bool = False,
     company_logo_url: Optional[str] = None,
-) -> EmailResult:
+) -> List[EmailResult]:
     """
     Notify staff when a party submits their portal form.
+    
+    Every recipient gets the same body, so they are sent as one SendGrid
+    request. Returns one EmailResult per recipient, in input order.
     """
-    role_display = "Buyer" if party_role == "transferee" else "Seller"
+    role_display = _role_short_display(party_role)
     
     if all_complete:
-        subject = f"All Parties Complete -- Ready for Review: {property_address}"
-        h_text = "All Parties Complete"
-        h_sub = property_address
-        accent = "green"
+        subject = _ALL_PARTIES_COMPLETE_SUBJECT(property_address)
+        template = _ALL_PARTIES_COMPLETE_HTML
+        text_template = _ALL_PARTIES_COMPLETE_TEXT
     else:
-        subject = f"Party Submitted: {party_name} ({role_display})"
-        h_text = "Party Submission Received"
-        h_sub = f"{party_name} -- {role_display}"
-        accent = "blue"
-
-    status_line = ""
-    if all_complete:
-        status_line = _text('<strong style="color:#059669;">All parties have now submitted. This report is ready for review and filing.</strong>')
-
-    body = (
-        _text(f"<strong>{party_name}</strong> ({role_display}) has submitted their information for:")
-        + _info_card("Property Address", property_address, "#059669" if all_complete else "#2563eb")
-        + status_line
-    )
-
-    report_url = f"{FRONTEND_URL}/app/staff/requests/{report_id}"
-
-    html_content = _build_email_wrapper(
-        body_content=body,
-        header_text=h_text,
-        header_subtext=h_sub,
-        action_url=report_url,
-        action_text="View Report",
-        header_accent=accent,
-        logo_mode="finclear",
-    )
-
-    text_content = f"""
-Party Submitted: {party_name}
+        subject = _PARTY_SUBMITTED_SUBJECT(party_name, role_display)
+        template = _PARTY_SUBMITTED_HTML
+        text_template = _PARTY_SUBMITTED_TEXT
 
-{party_name} ({role_display}) has submitted their information for:
-{property_address}
+    skipped = _precheck(staff_emails, subject, rendering=True)
+    if skipped is not None:
+        return [skipped for _ in staff_emails]
 
-{"ALL PARTIES COMPLETE -- Ready for review and filing." if all_complete else ""}
+    report_url = f"{get_settings().FRONTEND_URL}/app/staff/requests/{report_id}"
 
-View the report: {report_url}
-
----
-{BRAND_NAME} - {BRAND_TAGLINE}
-"""
+    html_content = template.format(**_escaped(
+        party_name=party_name,
+        role_display=role_display,
+        property_address=property_address,
+        report_url=report_url,
+    ))
+
+    # Hand-written text part; skipped like _plain_text_part() when INCLUDE_PLAINTEXT_BODY is off
+    text_content = None
+    if get_settings().INCLUDE_PLAINTEXT_BODY:
+        text_content = text_template.format(
+            party_name=party_name,
+            role_display=role_display,
+            property_address=property_address,
+            report_url=report_url,
+        )
     
-    return send_email(staff_email, subject, html_content, text_content)
+    return send_email_bulk([{"email": email} for email in staff_emails], subject, html_content, text_content)
 
 
 # ============================================================================
 # TEMPLATE 4: Invoice
 # ============================================================================
 
-def get_invoice_email_html(
-    company_name: str,
-    invoice_number: str,
-    total_dollars: float,
-    due_date: str,
-    period_start: str,
-    period_end: str,
-    view_link: str,
-    company_logo_url: Optional[str] = None,
-) -> str:
-    """Generate HTML for invoice email."""
+_INVOICE_PAYMENT_OPTIONS_HTML = '''
+                            <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="margin:16px 0;">
+                                <tr>
+                                    <td style="background-color:#ecfdf5; border:1px solid #86efac; padding:14px 18px; border-radius:8px;">
+                                        <p style="margin:0 0 6px; color:#166534; font-size:14px; font-weight:600;">
+                                            Payment Options:
+                                        </p>
+                                        <p style="margin:0; color:#15803d; font-size:13px;">
+                                            ACH Transfer &bull; Wire Transfer &bull; Check<br>
+                                            <span style="font-size:12px; color:#64748b;">Please reference invoice number with your payment.</span>
+                                        </p>
+                                    </td>
+                                </tr>
+                            </table>'''
 
-    body = (
-        _text(f"Dear {company_name},")
-        + _text("Your invoice for FinCEN filing services is now available.")
-        + f'''
+_INVOICE_BODY = (
+    _text("Dear {company_name},")
+    + _text("Your invoice for FinCEN filing services is now available.")
+    + '''
                             <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="margin:16px 0;">
                                 <tr>
                                     <td style="background-color:#eff6ff; border-left:4px solid #2563eb; padding:20px; border-radius:0 8px 8px 0;">
@@ -711,43 +1558,31 @@ def get_invoice_email_html(
                                             <tr>
                                                 <td style="padding:10px 0; border-top:2px solid #2563eb;">
                                                     <span style="color:#1e3a8a; font-size:16px; font-weight:600;">Amount Due:</span>
-                                                    <span style="color:#2563eb; font-size:24px; font-weight:700; float:right;">${total_dollars:,.2f}</span>
+                                                    <span style="color:#2563eb; font-size:24px; font-weight:700; float:right;">${total_formatted}</span>
                                                 </td>
                                             </tr>
                                         </table>
                                     </td>
                                 </tr>
                             </table>'''
-        + f'''
-                            <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="margin:16px 0;">
-                                <tr>
-                                    <td style="background-color:#ecfdf5; border:1px solid #86efac; padding:14px 18px; border-radius:8px;">
-                                        <p style="margin:0 0 6px; color:#166534; font-size:14px; font-weight:600;">
-                                            Payment Options:
-                                        </p>
-                                        <p style="margin:0; color:#15803d; font-size:13px;">
-                                            ACH Transfer &bull; Wire Transfer &bull; Check<br>
-                                            <span style="font-size:12px; color:#64748b;">Please reference invoice number with your payment.</span>
-                                        </p>
-                                    </td>
-                                </tr>
-                            </table>'''
-        + _muted("If you have any questions about this invoice, please contact our billing team.")
-    )
+    + _INVOICE_PAYMENT_OPTIONS_HTML
+    + _muted("If you have any questions about this invoice, please contact our billing team.")
+)
 
-    return _build_email_wrapper(
-        body_content=body,
-        header_text="Invoice",
-        header_subtext=invoice_number,
-        action_url=view_link,
-        action_text="View Invoice",
-        header_accent="blue",
-        footer_note=f"Questions? Contact {BRAND_SUPPORT_EMAIL}",
-        logo_mode="finclear",
-    )
 
+_INVOICE_HTML = _minify_html(_build_email_wrapper(
+    body_content=_INVOICE_BODY,
+    header_text="Invoice",
+    header_subtext="{invoice_number}",
+    action_url="{view_link}",
+    action_text="View Invoice",
+    header_accent="blue",
+    footer_note=f"Questions? Contact {BRAND_SUPPORT_EMAIL}",
+    logo_mode="finclear",
+))
 
-def get_invoice_email_text(
+
+def get_invoice_email_html(
     company_name: str,
     invoice_number: str,
     total_dollars: float,
@@ -755,41 +1590,60 @@ def get_invoice_email_text(
     period_start: str,
     period_end: str,
     view_link: str,
+    company_logo_url: Optional[str] = None,
 ) -> str:
-    """Generate plain text for invoice email."""
-    
-    return f"""
-INVOICE — {invoice_number}
-
-Dear {company_name},
-
-Your invoice for FinCEN filing services is now available.
-
----
-INVOICE SUMMARY
----
-Invoice Number: {invoice_number}
-Billing Period: {period_start} - {period_end}
-Due Date: {due_date}
-Amount Due: ${total_dollars:,.2f}
+    """Generate HTML for invoice email."""
+    return _invoice_html(
+        company_name, invoice_number, _format_dollars(total_dollars),
+        due_date, period_start, period_end, view_link,
+    )
 
-View your invoice online: {view_link}
 
----
-PAYMENT OPTIONS
----
-- ACH Transfer
-- Wire Transfer
-- Check
+def _format_dollars(total_dollars: float) -> str:
+    """Invoice amount as shown in the subject and body, e.g. "1,250.00"."""
+    return f"{total_dollars:,.2f}"
 
-Please reference invoice number {invoice_number} with your payment.
 
----
+def _invoice_html(
+    company_name: str,
+    invoice_number: str,
+    total_formatted: str,
+    due_date: str,
+    period_start: str,
+    period_end: str,
+    view_link: str,
+) -> str:
+    """Fill the invoice document with an amount already run through _format_dollars()."""
+    return _INVOICE_HTML.format(**_escaped(
+        company_name=company_name,
+        invoice_number=invoice_number,
+        total_formatted=total_formatted,
+        due_date=due_date,
+        period_start=period_start,
+        period_end=period_end,
+        view_link=view_link,
+    ))
 
-Questions? Contact {BRAND_SUPPORT_EMAIL}
 
-Powered by {BRAND_NAME} - {BRAND_TAGLINE}
-"""
+def get_invoice_email_text(
+    company_name: str,
+    invoice_number: str,
+    total_dollars: float,
+    due_date: str,
+    period_start: str,
+    period_end: str,
+    view_link: str,
+) -> str:
+    """Generate plain text for invoice email."""
+    return _html_to_text(get_invoice_email_html(
+        company_name=company_name,
+        invoice_number=invoice_number,
+        total_dollars=total_dollars,
+        due_date=due_date,
+        period_start=period_start,
+        period_end=period_end,
+        view_link=view_link,
+    ))
 
 
 def send_invoice_email(
@@ -805,30 +1659,38 @@ def send_invoice_email(
 ) -> EmailResult:
     """
     Send invoice email to company billing contact.
+    
+    Uses the SendGrid Dynamic Template when SENDGRID_INVOICE_TEMPLATE_ID
+    is set; otherwise renders the HTML locally.
     """
-    subject = f"Invoice {invoice_number} - ${total_dollars:,.2f} Due {due_date}"
+    # Formatted once for the subject, the body and the template data
+    total_formatted = _format_dollars(total_dollars)
+    subject = f"Invoice {invoice_number} - ${total_formatted} Due {due_date}"
     
-    html_content = get_invoice_email_html(
-        company_name=company_name,
-        invoice_number=invoice_number,
-        total_dollars=total_dollars,
-        due_date=due_date,
-        period_start=period_start,
-        period_end=period_end,
-        view_link=view_link,
-        company_logo_url=company_logo_url,
-    )
+    skipped = _precheck(to_email, subject, rendering=True)
+    if skipped is not None:
+        return skipped
     
-    text_content = get_invoice_email_text(
-        company_name=company_name,
-        invoice_number=invoice_number,
-        total_dollars=total_dollars,
-        due_date=due_date,
-        period_start=period_start,
-        period_end=period_end,
-        view_link=view_link,
+    settings = get_settings()
+    if settings.SENDGRID_ENABLED and settings.SENDGRID_INVOICE_TEMPLATE_ID:
+        return send_template_email(to_email, settings.SENDGRID_INVOICE_TEMPLATE_ID, {
+            "subject": subject,
+            "company_name": company_name,
+            "invoice_number": invoice_number,
+            "total_dollars": total_formatted,
+            "due_date": due_date,
+            "period_start": period_start,
+            "period_end": period_end,
+            "view_link": view_link,
+        })
+    
+    html_content = _invoice_html(
+        company_name, invoice_number, total_formatted,
+        due_date, period_start, period_end, view_link,
     )
     
+    text_content = _plain_text_part(html_content)
+    
     return send_email(to_email, subject, html_content, text_content)
 
 
@@ -836,51 +1698,175 @@ def send_invoice_email(
 # FILING STATUS NOTIFICATIONS (Client-Driven Flow)
 # ============================================================================
 
+# Documents prebuilt once at import; each send only fills in the
+# {placeholders} for the recipient and filing. Subjects are bound
+# str.format methods taking the property address.
+_FILING_SUBMITTED_SUBJECT = "Filing Submitted to FinCEN: {}".format
+
+_FILING_SUBMITTED_HTML = _minify_html(_build_email_wrapper(
+    body_content=(
+        _text("Hi {recipient_name},")
+        + _text("Your FinCEN Real Estate Report has been submitted for processing.")
+        + _detail_block(
+            _detail_row("Property", "{property_address}", "#1e3a8a")
+            + _detail_row("Submitted", "{submitted_at} UTC", "#1e3a8a")
+            + '<p style="margin:0; color:#1e3a8a;"><strong>Status:</strong> Awaiting FinCEN Response</p>',
+            "#2563eb",
+        )
+        + _text("You'll receive another email once FinCEN processes your filing (typically within 24-48 hours).")
+    ),
+    header_text="Filing Submitted",
+    header_subtext="{property_address}",
+    action_url="{report_url}",
+    action_text="View Filing Status",
+    header_accent="blue",
+    logo_mode="finclear",
+))
+
+_FILING_ACCEPTED_SUBJECT = "FinCEN Filing Complete: {}".format
+
+_FILING_ACCEPTED_HTML = _minify_html(_build_email_wrapper(
+    body_content=(
+        _text("Hi {recipient_name},")
+        + _text("Great news! Your FinCEN Real Estate Report has been <strong>accepted</strong>.")
+        + _detail_block(
+            _detail_row("Property", "{property_address}")
+            + '<p style="margin:0 0 8px; color:#065f46;"><strong>BSA ID:</strong> <code style="background:#d1fae5; padding:2px 8px; border-radius:4px; font-family:monospace; font-size:15px;">{bsa_id}</code></p>'
+            + _detail_row("Filed", "{filed_at_str}"),
+            "#059669",
+        )
+        + _text('<strong style="color:#d97706;">Save this BSA ID for your records.</strong> This is your official FinCEN receipt number.')
+        + _muted("This filing will be stored securely for 5 years per FinCEN requirements.")
+    ),
+    header_text="Filing Complete",
+    header_subtext="BSA ID: {bsa_id}",
+    action_url="{report_url}",
+    action_text="View Filing Details",
+    header_accent="green",
+    button_color="#059669",
+    logo_mode="finclear",
+))
+
+_FILING_REJECTED_SUBJECT = "Action Required: FinCEN Filing Rejected -- {}".format
+
+_FILING_REJECTED_HTML = _minify_html(_build_email_wrapper(
+    body_content=(
+        _text("Hi {recipient_name},")
+        + _text("Your FinCEN Real Estate Report was <strong>rejected</strong> and requires attention.")
+        + _detail_block(
+            _detail_row("Property", "{property_address}", "#991b1b")
+            + '<p style="margin:0 0 8px; color:#991b1b;"><strong>Error Code:</strong> <code style="background:#fee2e2; padding:2px 8px; border-radius:4px;">{rejection_code}</code></p>'
+            + '<p style="margin:0; color:#991b1b;"><strong>Reason:</strong> {rejection_message}</p>',
+            "#dc2626",
+        )
+        + _text("<strong>What to do:</strong>")
+        + '''
+                            <ol style="margin:0 0 16px; color:#334155; font-size:15px; padding-left:20px;">
+                                <li style="margin-bottom:6px;">Review the error details above</li>
+                                <li style="margin-bottom:6px;">Correct the information in the report</li>
+                                <li>Re-submit the filing</li>
+                            </ol>'''
+        + _muted(f"Need help? Contact {BRAND_SUPPORT_EMAIL}")
+    ),
+    header_text="Filing Rejected",
+    header_subtext="{property_address}",
+    action_url="{report_url}",
+    action_text="Fix and Resubmit",
+    header_accent="red",
+    button_color="#dc2626",
+    logo_mode="finclear",
+))
+
+_FILING_NEEDS_REVIEW_SUBJECT = "Review Required: FinCEN Filing -- {}".format
+
+_FILING_NEEDS_REVIEW_HTML = _minify_html(_build_email_wrapper(
+    body_content=(
+        _text("Hi {recipient_name},")
+        + _text("Your FinCEN Real Estate Report requires review before it can be filed.")
+        + _detail_block(
+            _detail_row("Property", "{property_address}", "#92400e")
+            + '<p style="margin:0; color:#92400e;"><strong>Reason:</strong> {reason}</p>',
+            "#d97706",
+        )
+    ),
+    header_text="Review Required",
+    header_subtext="{property_address}",
+    action_url="{report_url}",
+    action_text="Review Report",
+    header_accent="amber",
+    button_color="#d97706",
+    logo_mode="finclear",
+))
+
+
+# Subject and document per filing status, for the shared helpers below
+_FILING_EMAILS = {
+    "submitted": (_FILING_SUBMITTED_SUBJECT, _FILING_SUBMITTED_HTML),
+    "accepted": (_FILING_ACCEPTED_SUBJECT, _FILING_ACCEPTED_HTML),
+    "rejected": (_FILING_REJECTED_SUBJECT, _FILING_REJECTED_HTML),
+    "needs_review": (_FILING_NEEDS_REVIEW_SUBJECT, _FILING_NEEDS_REVIEW_HTML),
+}
+
+
+def _filing_email(status: str, property_address: str, **fields) -> Tuple[str, str]:
+    """Subject and HTML for a filing status; fields fill that document's slots."""
+    subject, template = _FILING_EMAILS[status]
+    html_content = template.format(**_escaped(property_address=property_address, **fields))
+    return subject(property_address), html_content
+
+
+def _send_filing_notification(status: str, to_email: str, property_address: str, **fields) -> EmailResult:
+    """Send a filing status email, returning before rendering when sending is off."""
+    skipped = _precheck(to_email, _FILING_EMAILS[status][0](property_address), rendering=True)
+    if skipped is not None:
+        return skipped
+
+    subject, html_content = _filing_email(status, property_address, **fields)
+    return send_email(to_email, subject, html_content, _plain_text_part(html_content))
+
+
+def get_filing_submitted_email(
+    recipient_name: str,
+    property_address: str,
+    submitted_at_str: str,
+    report_url: str,
+) -> Tuple[str, str]:
+    """Subject and HTML for the filing submitted notification."""
+    return _filing_email(
+        "submitted", property_address,
+        recipient_name=recipient_name, submitted_at=submitted_at_str, report_url=report_url,
+    )
+
+
 def send_filing_submitted_notification(
     to_email: str,
     recipient_name: str,
     property_address: str,
+    submitted_at_str: str,
     report_url: str,
     company_logo_url: Optional[str] = None,
 ) -> EmailResult:
     """
     Notify when filing is submitted to FinCEN (pending acceptance).
     """
-    from datetime import datetime
-    submitted_at = datetime.utcnow()
-
-    subject = f"Filing Submitted to FinCEN: {property_address}"
-
-    details = (
-        _detail_row("Property", property_address)
-        + _detail_row("Submitted", submitted_at.strftime('%B %d, %Y at %I:%M %p') + " UTC")
-        + _detail_row("Status", "Awaiting FinCEN Response").rstrip("</p>").rstrip()
-    )
-    # Fix last row to not have trailing margin
-    details = (
-        _detail_row("Property", property_address, "#1e3a8a")
-        + _detail_row("Submitted", submitted_at.strftime('%B %d, %Y at %I:%M %p') + " UTC", "#1e3a8a")
-        + f'<p style="margin:0; color:#1e3a8a;"><strong>Status:</strong> Awaiting FinCEN Response</p>'
+    return _send_filing_notification(
+        "submitted", to_email, property_address,
+        recipient_name=recipient_name, submitted_at=submitted_at_str, report_url=report_url,
     )
 
-    body = (
-        _text(f"Hi {recipient_name},")
-        + _text("Your FinCEN Real Estate Report has been submitted for processing.")
-        + _detail_block(details, "#2563eb")
-        + _text("You'll receive another email once FinCEN processes your filing (typically within 24-48 hours).")
-    )
 
-    html_content = _build_email_wrapper(
-        body_content=body,
-        header_text="Filing Submitted",
-        header_subtext=property_address,
-        action_url=report_url,
-        action_text="View Filing Status",
-        header_accent="blue",
-        logo_mode="finclear",
+def get_filing_accepted_email(
+    recipient_name: str,
+    property_address: str,
+    bsa_id: str,
+    filed_at_str: str,
+    report_url: str,
+) -> Tuple[str, str]:
+    """Subject and HTML for the filing accepted notification."""
+    return _filing_email(
+        "accepted", property_address,
+        recipient_name=recipient_name, bsa_id=bsa_id, filed_at_str=filed_at_str, report_url=report_url,
     )
-    
-    return send_email(to_email, subject, html_content)
 
 
 def send_filing_accepted_notification(
@@ -895,34 +1881,25 @@ def send_filing_accepted_notification(
     """
     Notify when filing is accepted by FinCEN with BSA ID.
     """
-    subject = f"FinCEN Filing Complete: {property_address}"
-
-    details = (
-        _detail_row("Property", property_address)
-        + f'<p style="margin:0 0 8px; color:#065f46;"><strong>BSA ID:</strong> <code style="background:#d1fae5; padding:2px 8px; border-radius:4px; font-family:monospace; font-size:15px;">{bsa_id}</code></p>'
-        + _detail_row("Filed", filed_at_str)
+    return _send_filing_notification(
+        "accepted", to_email, property_address,
+        recipient_name=recipient_name, bsa_id=bsa_id, filed_at_str=filed_at_str, report_url=report_url,
     )
 
-    body = (
-        _text(f"Hi {recipient_name},")
-        + _text("Great news! Your FinCEN Real Estate Report has been <strong>accepted</strong>.")
-        + _detail_block(details, "#059669")
-        + _text('<strong style="color:#d97706;">Save this BSA ID for your records.</strong> This is your official FinCEN receipt number.')
-        + _muted("This filing will be stored securely for 5 years per FinCEN requirements.")
-    )
 
-    html_content = _build_email_wrapper(
-        body_content=body,
-        header_text="Filing Complete",
-        header_subtext=f"BSA ID: {bsa_id}",
-        action_url=report_url,
-        action_text="View Filing Details",
-        header_accent="green",
-        button_color="#059669",
-        logo_mode="finclear",
+def get_filing_rejected_email(
+    recipient_name: str,
+    property_address: str,
+    rejection_code: str,
+    rejection_message: str,
+    report_url: str,
+) -> Tuple[str, str]:
+    """Subject and HTML for the filing rejected notification."""
+    return _filing_email(
+        "rejected", property_address,
+        recipient_name=recipient_name, rejection_code=rejection_code,
+        rejection_message=rejection_message, report_url=report_url,
     )
-    
-    return send_email(to_email, subject, html_content)
 
 
 def send_filing_rejected_notification(
@@ -937,40 +1914,24 @@ def send_filing_rejected_notification(
     """
     Notify when filing is rejected by FinCEN -- URGENT.
     """
-    subject = f"Action Required: FinCEN Filing Rejected -- {property_address}"
-
-    details = (
-        _detail_row("Property", property_address, "#991b1b")
-        + f'<p style="margin:0 0 8px; color:#991b1b;"><strong>Error Code:</strong> <code style="background:#fee2e2; padding:2px 8px; border-radius:4px;">{rejection_code}</code></p>'
-        + f'<p style="margin:0; color:#991b1b;"><strong>Reason:</strong> {rejection_message}</p>'
+    return _send_filing_notification(
+        "rejected", to_email, property_address,
+        recipient_name=recipient_name, rejection_code=rejection_code,
+        rejection_message=rejection_message, report_url=report_url,
     )
 
-    body = (
-        _text(f"Hi {recipient_name},")
-        + _text("Your FinCEN Real Estate Report was <strong>rejected</strong> and requires attention.")
-        + _detail_block(details, "#dc2626")
-        + _text("<strong>What to do:</strong>")
-        + f'''
-                            <ol style="margin:0 0 16px; color:#334155; font-size:15px; padding-left:20px;">
-                                <li style="margin-bottom:6px;">Review the error details above</li>
-                                <li style="margin-bottom:6px;">Correct the information in the report</li>
-                                <li>Re-submit the filing</li>
-                            </ol>'''
-        + _muted(f"Need help? Contact {BRAND_SUPPORT_EMAIL}")
-    )
 
-    html_content = _build_email_wrapper(
-        body_content=body,
-        header_text="Filing Rejected",
-        header_subtext=property_address,
-        action_url=report_url,
-        action_text="Fix and Resubmit",
-        header_accent="red",
-        button_color="#dc2626",
-        logo_mode="finclear",
+def get_filing_needs_review_email(
+    recipient_name: str,
+    property_address: str,
+    reason: str,
+    report_url: str,
+) -> Tuple[str, str]:
+    """Subject and HTML for the filing needs-review notification."""
+    return _filing_email(
+        "needs_review", property_address,
+        recipient_name=recipient_name, reason=reason, report_url=report_url,
     )
-    
-    return send_email(to_email, subject, html_content)
 
 
 def send_filing_needs_review_notification(
@@ -984,37 +1945,45 @@ def send_filing_needs_review_notification(
     """
     Notify when filing needs manual review.
     """
-    subject = f"Review Required: FinCEN Filing -- {property_address}"
-
-    details = (
-        _detail_row("Property", property_address, "#92400e")
-        + f'<p style="margin:0; color:#92400e;"><strong>Reason:</strong> {reason}</p>'
-    )
-
-    body = (
-        _text(f"Hi {recipient_name},")
-        + _text("Your FinCEN Real Estate Report requires review before it can be filed.")
-        + _detail_block(details, "#d97706")
+    return _send_filing_notification(
+        "needs_review", to_email, property_address,
+        recipient_name=recipient_name, reason=reason, report_url=report_url,
     )
 
-    html_content = _build_email_wrapper(
-        body_content=body,
-        header_text="Review Required",
-        header_subtext=property_address,
-        action_url=report_url,
-        action_text="Review Report",
-        header_accent="amber",
-        button_color="#d97706",
-        logo_mode="finclear",
-    )
-    
-    return send_email(to_email, subject, html_content)
-
 
 # ============================================================================
 # EXEMPT DETERMINATION NOTIFICATION
 # ============================================================================
 
+_EXEMPT_SUBJECT = "Exempt Determination -- {}".format
+
+_EXEMPT_NO_REASONS_HTML = '<p style="margin:8px 0 0; color:#065f46;">Transaction qualifies for exemption under FinCEN regulations.</p>'
+
+_EXEMPT_HTML = _minify_html(_build_email_wrapper(
+    body_content=(
+        _text("Hi {recipient_name},")
+        + _text('The real estate transaction below has been determined <strong style="color:#059669;">EXEMPT</strong> from FinCEN reporting requirements.')
+        + _detail_block(
+            _detail_row("Property", "{property_address}")
+            + _detail_row("Determination Date", "{determination_date}")
+            + '<p style="margin:0 0 8px; color:#065f46;"><strong>Certificate ID:</strong> <code style="background:#d1fae5; padding:2px 8px; border-radius:4px; font-family:monospace;">{certificate_id}</code></p>'
+            + '<p style="margin:0; color:#065f46;"><strong>Exemption Reason(s):</strong></p>'
+            + "{reasons_html}",
+            "#059669",
+        )
+        + _text("<strong>No further action is required for this transaction.</strong>")
+        + _muted("This exemption certificate is stored securely and can be accessed at any time from your dashboard.")
+    ),
+    header_text="Transaction Exempt",
+    header_subtext="{property_address}",
+    action_url="{report_url}",
+    action_text="Download Exemption Certificate",
+    header_accent="green",
+    button_color="#059669",
+    logo_mode="finclear",
+))
+
+
 def get_exempt_notification_html(
     recipient_name: str,
     property_address: str,
@@ -1025,42 +1994,43 @@ def get_exempt_notification_html(
     company_logo_url: Optional[str] = None,
 ) -> str:
     """Generate HTML for exempt determination notification email."""
-    
-    reasons_html = ""
-    if exemption_reasons:
+    return _exempt_html(
+        recipient_name, property_address, determination_date,
+        _exempt_reasons(exemption_reasons), certificate_id, report_url,
+    )
+
+
+def _exempt_reasons(exemption_reasons: Optional[list]) -> List[str]:
+    """Non-empty reasons as strings; one pass shared by the HTML and text bodies."""
+    return [str(r) for r in exemption_reasons or () if r]
+
+
+def _exempt_html(
+    recipient_name: str,
+    property_address: str,
+    determination_date: str,
+    reasons: List[str],
+    certificate_id: str,
+    report_url: str,
+) -> str:
+    if reasons:
         items = "".join(
-            f'<li style="margin-bottom:4px; color:#065f46;">{r}</li>'
-            for r in exemption_reasons if r
+            f'<li style="margin-bottom:4px; color:#065f46;">{html.escape(r)}</li>'
+            for r in reasons
         )
         reasons_html = f'<ul style="margin:8px 0 0; padding-left:20px;">{items}</ul>'
     else:
-        reasons_html = '<p style="margin:8px 0 0; color:#065f46;">Transaction qualifies for exemption under FinCEN regulations.</p>'
-
-    details = (
-        _detail_row("Property", property_address)
-        + _detail_row("Determination Date", determination_date)
-        + f'<p style="margin:0 0 8px; color:#065f46;"><strong>Certificate ID:</strong> <code style="background:#d1fae5; padding:2px 8px; border-radius:4px; font-family:monospace;">{certificate_id}</code></p>'
-        + f'<p style="margin:0; color:#065f46;"><strong>Exemption Reason(s):</strong></p>'
-        + reasons_html
-    )
-
-    body = (
-        _text(f"Hi {recipient_name},")
-        + _text('The real estate transaction below has been determined <strong style="color:#059669;">EXEMPT</strong> from FinCEN reporting requirements.')
-        + _detail_block(details, "#059669")
-        + _text("<strong>No further action is required for this transaction.</strong>")
-        + _muted("This exemption certificate is stored securely and can be accessed at any time from your dashboard.")
-    )
-
-    return _build_email_wrapper(
-        body_content=body,
-        header_text="Transaction Exempt",
-        header_subtext=property_address,
-        action_url=report_url,
-        action_text="Download Exemption Certificate",
-        header_accent="green",
-        button_color="#059669",
-        logo_mode="finclear",
+        reasons_html = _EXEMPT_NO_REASONS_HTML
+
+    return _EXEMPT_HTML.format(
+        reasons_html=reasons_html,
+        **_escaped(
+            recipient_name=recipient_name,
+            property_address=property_address,
+            determination_date=determination_date,
+            certificate_id=certificate_id,
+            report_url=report_url,
+        ),
     )
 
 
@@ -1073,7 +2043,24 @@ def get_exempt_notification_text(
     report_url: str,
 ) -> str:
     """Generate plain text for exempt determination notification email."""
-    reasons_text = "\n".join(f"  - {r}" for r in exemption_reasons if r) if exemption_reasons else "  - Transaction qualifies for exemption under FinCEN regulations."
+    return _exempt_text(
+        recipient_name, property_address, determination_date,
+        _exempt_reasons(exemption_reasons), certificate_id, report_url,
+    )
+
+
+def _exempt_text(
+    recipient_name: str,
+    property_address: str,
+    determination_date: str,
+    reasons: List[str],
+    certificate_id: str,
+    report_url: str,
+) -> str:
+    if reasons:
+        reasons_text = "\n".join(f"  - {r}" for r in reasons)
+    else:
+        reasons_text = "  - Transaction qualifies for exemption under FinCEN regulations."
     
     return f"""
 TRANSACTION EXEMPT -- No FinCEN Filing Required
@@ -1109,26 +2096,22 @@ def send_exempt_notification(
     company_logo_url: Optional[str] = None,
 ) -> EmailResult:
     """Send exempt determination notification to escrow officer."""
-    subject = f"Exempt Determination -- {property_address}"
+    subject = _EXEMPT_SUBJECT(property_address)
     
-    html_content = get_exempt_notification_html(
-        recipient_name=recipient_name,
-        property_address=property_address,
-        determination_date=determination_date,
-        exemption_reasons=exemption_reasons,
-        certificate_id=certificate_id,
-        report_url=report_url,
-        company_logo_url=company_logo_url,
-    )
+    skipped = _precheck(to_email, subject, rendering=True)
+    if skipped is not None:
+        return skipped
     
-    text_content = get_exempt_notification_text(
-        recipient_name=recipient_name,
-        property_address=property_address,
-        determination_date=determination_date,
-        exemption_reasons=exemption_reasons,
-        certificate_id=certificate_id,
-        report_url=report_url,
+    # Reasons are normalized once and shared by both bodies
+    fields = (
+        recipient_name, property_address, determination_date,
+        _exempt_reasons(exemption_reasons), certificate_id, report_url,
     )
+    html_content = _exempt_html(*fields)
+    
+    text_content = None
+    if get_settings().INCLUDE_PLAINTEXT_BODY:
+        text_content = _exempt_text(*fields)
     
     return send_email(to_email, subject, html_content, text_content)
 
@@ -1137,43 +2120,24 @@ def send_exempt_notification(
 # LINKS SENT CONFIRMATION TO ESCROW OFFICER
 # ============================================================================
 
-def get_links_sent_confirmation_html(
-    recipient_name: str,
-    property_address: str,
-    parties: list,
-    report_url: str,
-    company_logo_url: Optional[str] = None,
-) -> str:
-    """Generate HTML for links-sent confirmation email to escrow officer."""
-    
-    # Build party list table rows
-    party_rows = ""
-    for p in parties:
-        role_display = (
-            "Buyer" if p.get("role") == "transferee"
-            else "Seller" if p.get("role") == "transferor"
-            else p.get("role", "Party").replace("_", " ").title()
-        )
-        email_display = p.get("email", "No email")
-        name_display = p.get("name", "Unnamed")
-        sent_badge = (
-            '<span style="color:#059669; font-weight:600;">Sent</span>'
-            if p.get("email")
-            else '<span style="color:#d97706;">No email</span>'
-        )
-        party_rows += f"""
+_LINKS_SENT_PARTY_ROW = """
                                     <tr>
-                                        <td style="padding:10px 12px; border-bottom:1px solid #e2e8f0;">{name_display}</td>
-                                        <td style="padding:10px 12px; border-bottom:1px solid #e2e8f0;">{role_display}</td>
-                                        <td style="padding:10px 12px; border-bottom:1px solid #e2e8f0;">{email_display}</td>
-                                        <td style="padding:10px 12px; border-bottom:1px solid #e2e8f0; text-align:center;">{sent_badge}</td>
+                                        <td style="padding:10px 12px; border-bottom:1px solid #e2e8f0;">{name}</td>
+                                        <td style="padding:10px 12px; border-bottom:1px solid #e2e8f0;">{role}</td>
+                                        <td style="padding:10px 12px; border-bottom:1px solid #e2e8f0;">{email}</td>
+                                        <td style="padding:10px 12px; border-bottom:1px solid #e2e8f0; text-align:center;">{badge}</td>
                                     </tr>"""
+_LINKS_SENT_BADGE_SENT = '<span style="color:#059669; font-weight:600;">Sent</span>'
+_LINKS_SENT_BADGE_NO_EMAIL = '<span style="color:#d97706;">No email</span>'
 
-    body = (
-        _text(f"Hi {recipient_name},")
+_LINKS_SENT_SUBJECT = "Party Links Sent -- {}".format
+
+_LINKS_SENT_HTML = _minify_html(_build_email_wrapper(
+    body_content=(
+        _text("Hi {recipient_name},")
         + _text("Portal invitation links have been sent to the following parties for:")
-        + _info_card("Property Address", property_address, "#2563eb")
-        + f'''
+        + _info_card("Property Address", "{property_address}", "#2563eb")
+        + '''
                             <table width="100%" cellspacing="0" cellpadding="0" style="margin:16px 0; font-size:13px; border:1px solid #e2e8f0; border-radius:8px; overflow:hidden;">
                                 <tr style="background:#f8fafc;">
                                     <th style="padding:10px 12px; text-align:left; color:#334155; font-weight:600; border-bottom:2px solid #e2e8f0;">Name</th>
@@ -1184,16 +2148,56 @@ def get_links_sent_confirmation_html(
                                 {party_rows}
                             </table>'''
         + _text("You will be notified when each party submits their information. You can also monitor progress from your dashboard.")
+    ),
+    header_text="Party Links Sent",
+    header_subtext="{property_address}",
+    action_url="{report_url}",
+    action_text="View Status",
+    header_accent="blue",
+    logo_mode="finclear",
+))
+
+
+def get_links_sent_confirmation_html(
+    recipient_name: str,
+    property_address: str,
+    parties: list,
+    report_url: str,
+    company_logo_url: Optional[str] = None,
+) -> str:
+    """Generate HTML for links-sent confirmation email to escrow officer."""
+    return _links_sent_html(recipient_name, property_address, _links_sent_parties(parties), report_url)
+
+
+def _links_sent_parties(parties: list) -> List[Tuple[str, str, Optional[str]]]:
+    """(name, role label, email) per party; one pass shared by the HTML and text bodies."""
+    return [
+        (p.get("name") or "Unnamed", _role_short_display(p.get("role") or "Party"), p.get("email"))
+        for p in parties
+    ]
+
+
+def _links_sent_html(
+    recipient_name: str,
+    property_address: str,
+    parties: List[Tuple[str, str, Optional[str]]],
+    report_url: str,
+) -> str:
+    party_rows = "".join(
+        _LINKS_SENT_PARTY_ROW.format(
+            badge=_LINKS_SENT_BADGE_SENT if email else _LINKS_SENT_BADGE_NO_EMAIL,
+            **_escaped(name=name, role=role, email=email or "No email"),
+        )
+        for name, role, email in parties
     )
 
-    return _build_email_wrapper(
-        body_content=body,
-        header_text="Party Links Sent",
-        header_subtext=property_address,
-        action_url=report_url,
-        action_text="View Status",
-        header_accent="blue",
-        logo_mode="finclear",
+    return _LINKS_SENT_HTML.format(
+        party_rows=party_rows,
+        **_escaped(
+            recipient_name=recipient_name,
+            property_address=property_address,
+            report_url=report_url,
+        ),
     )
 
 
@@ -1204,10 +2208,19 @@ def get_links_sent_confirmation_text(
     report_url: str,
 ) -> str:
     """Generate plain text for links-sent confirmation email."""
-    party_lines = ""
-    for p in parties:
-        role = "Buyer" if p.get("role") == "transferee" else "Seller" if p.get("role") == "transferor" else p.get("role", "Party")
-        party_lines += f"  - {p.get('name', 'Unnamed')} ({role}) -- {p.get('email', 'No email')}\n"
+    return _links_sent_text(recipient_name, property_address, _links_sent_parties(parties), report_url)
+
+
+def _links_sent_text(
+    recipient_name: str,
+    property_address: str,
+    parties: List[Tuple[str, str, Optional[str]]],
+    report_url: str,
+) -> str:
+    party_lines = "".join(
+        f"  - {name} ({role}) -- {email or 'No email'}\n"
+        for name, role, email in parties
+    )
     
     return f"""
 PARTY LINKS SENT -- {property_address}
@@ -1235,22 +2248,19 @@ def send_links_sent_confirmation(
     company_logo_url: Optional[str] = None,
 ) -> EmailResult:
     """Send links-sent confirmation to escrow officer."""
-    subject = f"Party Links Sent -- {property_address}"
+    subject = _LINKS_SENT_SUBJECT(property_address)
     
-    html_content = get_links_sent_confirmation_html(
-        recipient_name=recipient_name,
-        property_address=property_address,
-        parties=parties,
-        report_url=report_url,
-        company_logo_url=company_logo_url,
-    )
+    skipped = _precheck(to_email, subject, rendering=True)
+    if skipped is not None:
+        return skipped
     
-    text_content = get_links_sent_confirmation_text(
-        recipient_name=recipient_name,
-        property_address=property_address,
-        parties=parties,
-        report_url=report_url,
-    )
+    # Parties are normalized once and shared by both bodies
+    fields = (recipient_name, property_address, _links_sent_parties(parties), report_url)
+    html_content = _links_sent_html(*fields)
+    
+    text_content = None
+    if get_settings().INCLUDE_PLAINTEXT_BODY:
+        text_content = _links_sent_text(*fields)
     
     return send_email(to_email, subject, html_content, text_content)
 
@@ -1259,6 +2269,39 @@ def send_links_sent_confirmation(
 # PARTY NUDGE (7-DAY REMINDER)
 # ============================================================================
 
+_PARTY_NUDGE_WRAPPER_ARGS = dict(
+    body_content=(
+        _text("Dear {greeting},")
+        + _text(
+            "This is a friendly reminder that we still need your information for a real estate transaction. "
+            "You were previously sent a secure portal link, but we haven't received your submission yet."
+        )
+        + _detail_block(
+            _detail_row("Property", "{property_address}", "#92400e")
+            + '<p style="margin:0; color:#92400e;"><strong>Your Role:</strong> {role_display}</p>',
+            "#d97706",
+        )
+        + _text("Your prompt response helps ensure a smooth closing process. Please complete the secure form at your earliest convenience.")
+        + _muted("If you have already completed this form, please disregard this email. If you need a new link, please contact your title company representative.")
+    ),
+    header_text="Friendly Reminder",
+    header_subtext="Your Information is Still Needed",
+    action_url="{portal_url}",
+    action_text="Complete Your Submission",
+    header_accent="amber",
+    button_color="#2563eb",
+    logo_mode="company",
+)
+_PARTY_NUDGE_HTML_WITH_LOGO = _minify_html(_build_email_wrapper(
+    company_logo_url="{company_logo_url}",
+    **_PARTY_NUDGE_WRAPPER_ARGS,
+))
+_PARTY_NUDGE_HTML_WITH_NAME = _minify_html(_build_email_wrapper(
+    company_name="{company_display_name}",
+    **_PARTY_NUDGE_WRAPPER_ARGS,
+))
+
+
 def get_party_nudge_html(
     party_name: str,
     party_role: str,
@@ -1268,37 +2311,16 @@ def get_party_nudge_html(
     company_name: Optional[str] = None,
 ) -> str:
     """Generate HTML for party nudge reminder email."""
-    role_display = party_role.replace("_", " ").title()
-    greeting = party_name if party_name else "Property Transaction Party"
-
-    details = (
-        _detail_row("Property", property_address, "#92400e")
-        + f'<p style="margin:0; color:#92400e;"><strong>Your Role:</strong> {role_display}</p>'
-    )
-
-    body = (
-        _text(f"Dear {greeting},")
-        + _text(
-            "This is a friendly reminder that we still need your information for a real estate transaction. "
-            "You were previously sent a secure portal link, but we haven't received your submission yet."
-        )
-        + _detail_block(details, "#d97706")
-        + _text("Your prompt response helps ensure a smooth closing process. Please complete the secure form at your earliest convenience.")
-        + _muted("If you have already completed this form, please disregard this email. If you need a new link, please contact your title company representative.")
-    )
+    template = _PARTY_NUDGE_HTML_WITH_LOGO if company_logo_url else _PARTY_NUDGE_HTML_WITH_NAME
 
-    return _build_email_wrapper(
-        body_content=body,
+    return template.format(**_escaped(
+        greeting=party_name if party_name else "Property Transaction Party",
+        role_display=_role_display(party_role),
+        property_address=property_address,
+        portal_url=portal_url,
         company_logo_url=company_logo_url,
-        header_text="Friendly Reminder",
-        header_subtext="Your Information is Still Needed",
-        action_url=portal_url,
-        action_text="Complete Your Submission",
-        header_accent="amber",
-        button_color="#2563eb",
-        logo_mode="company",
-        company_name=company_name,
-    )
+        company_display_name=company_name or "Your Escrow Company",
+    ))
 
 
 def get_party_nudge_text(
@@ -1308,7 +2330,7 @@ def get_party_nudge_text(
     portal_url: str,
 ) -> str:
     """Generate plain text for party nudge reminder email."""
-    role_display = party_role.replace("_", " ").title()
+    role_display = _role_display(party_role)
     greeting = party_name if party_name else "Property Transaction Party"
     
     return f"""
@@ -1333,18 +2355,18 @@ If you have already completed this form, please disregard this email.
 """
 
 
-def send_party_nudge(
-    to_email: str,
+_PARTY_NUDGE_SUBJECT = "Reminder: Your Information is Needed -- {}".format
+
+
+def _render_party_nudge(
     party_name: str,
     party_role: str,
     property_address: str,
     portal_url: str,
-    company_logo_url: Optional[str] = None,
-    company_name: Optional[str] = None,
-) -> EmailResult:
-    """Send party nudge reminder email."""
-    subject = f"Reminder: Your Information is Needed -- {property_address}"
-    
+    company_logo_url: Optional[str],
+    company_name: Optional[str],
+) -> Tuple[str, Optional[str]]:
+    """HTML and text parts of a nudge, shared by the single and bulk senders."""
     html_content = get_party_nudge_html(
         party_name=party_name,
         party_role=party_role,
@@ -1354,30 +2376,62 @@ def send_party_nudge(
         company_name=company_name,
     )
     
-    text_content = get_party_nudge_text(
-        party_name=party_name,
-        party_role=party_role,
-        property_address=property_address,
-        portal_url=portal_url,
-    )
+    text_content = None
+    if get_settings().INCLUDE_PLAINTEXT_BODY:
+        text_content = get_party_nudge_text(
+            party_name=party_name,
+            party_role=party_role,
+            property_address=property_address,
+            portal_url=portal_url,
+        )
     
-    return send_email(to_email, subject, html_content, text_content)
+    return html_content, text_content
 
 
-# ============================================================================
-# Legacy helper — kept for backward compatibility
-# ============================================================================
+def send_party_nudge(
+    to_email: str,
+    party_name: str,
+    party_role: str,
+    property_address: str,
+    portal_url: str,
+    company_logo_url: Optional[str] = None,
+    company_name: Optional[str] = None,
+) -> EmailResult:
+    """Send party nudge reminder email."""
+    subject = _PARTY_NUDGE_SUBJECT(property_address)
+    
+    skipped = _precheck(to_email, subject, rendering=True)
+    if skipped is not None:
+        return skipped
+    
+    html_content, text_content = _render_party_nudge(
+        party_name, party_role, property_address, portal_url, company_logo_url, company_name,
+    )
+    return send_email(to_email, subject, html_content, text_content)
+
 
-def _build_company_logo_block(company_logo_url: Optional[str] = None) -> str:
-    """Build a reusable company logo HTML block for email templates.
+def send_party_nudges_bulk(
+    nudges: List[Dict],
+    property_address: str,
+    company_name: Optional[str] = None,
+    company_logo_url: Optional[str] = None,
+) -> List[EmailResult]:
+    """
+    Send nudges to several parties on one transaction in a single request.
     
-    NOTE: This is kept for backward compatibility only. All templates now
-    use _build_email_wrapper() which handles logo display natively.
+    Each nudge is a dict with "to_email", "party_name", "party_role" and
+    "portal_url"; rendered once with the same substitution tokens as
+    send_party_invites_bulk(). Returns one EmailResult per nudge, in order.
     """
-    if not company_logo_url:
-        return ""
-    return f'''
-            <div style="text-align: center; margin-bottom: 20px;">
-                <img src="{company_logo_url}" alt="Company Logo" style="max-height: 60px; max-width: 200px; object-fit: contain;" />
-            </div>'''
-
+    subject = _PARTY_NUDGE_SUBJECT(property_address)
+    
+    skipped = _precheck([nudge["to_email"] for nudge in nudges], subject, rendering=True)
+    if skipped is not None:
+        return [skipped for _ in nudges]
+    
+    html_content, text_content = _render_party_nudge(
+        "-Greeting-", "-Role-", property_address, "-Link-", company_logo_url, company_name,
+    )
+    return send_email_bulk(
+        _party_bulk_recipients(nudges, "portal_url"), subject, html_content, _party_text_part(text_content),
+    )
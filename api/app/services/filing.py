@@ -7,6 +7,9 @@ import string
 from datetime import datetime
 from typing import Dict, Any
 
+# Characters used in the random part of mock confirmation numbers
+_CONFIRMATION_ALPHABET = string.ascii_uppercase + string.digits
+
 
 class MockFilingProvider:
     """
@@ -18,10 +21,8 @@ class MockFilingProvider:
     @staticmethod
     def generate_confirmation_number() -> str:
         """Generate a realistic-looking confirmation number."""
-        prefix = "RRER"
-        year = datetime.utcnow().strftime("%Y")
-        random_part = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
-        return f"{prefix}-{year}-{random_part}"
+        random_part = ''.join(random.choices(_CONFIRMATION_ALPHABET, k=8))
+        return f"RRER-{datetime.utcnow():%Y}-{random_part}"
     
     @staticmethod
     def file_report(report_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -59,7 +60,7 @@ class MockFilingProvider:
         Returns validation result with any errors.
         """
         errors = []
-        warnings = []
+        parties = report_data.get("parties") or []
         
         # Check required fields (simplified for demo)
         if not report_data.get("property_address"):
@@ -68,16 +69,18 @@ class MockFilingProvider:
         if not report_data.get("closing_date"):
             errors.append("Closing date is required")
         
-        if not report_data.get("parties") or len(report_data["parties"]) == 0:
+        if not parties:
             errors.append("At least one transferee party is required")
         
         # Check party completeness
-        for party in report_data.get("parties", []):
-            if party.get("status") != "submitted":
-                warnings.append(f"Party {party.get('display_name', 'Unknown')} has not submitted their information")
+        warnings = [
+            f"Party {party.get('display_name', 'Unknown')} has not submitted their information"
+            for party in parties
+            if party.get("status") != "submitted"
+        ]
         
         return {
-            "is_valid": len(errors) == 0,
+            "is_valid": not errors,
             "errors": errors,
             "warnings": warnings,
         }
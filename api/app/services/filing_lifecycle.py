@@ -7,13 +7,21 @@ Includes auto-file capability and notification dispatch for client-driven flow.
 import hashlib
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Tuple, List
+from functools import partial
+from typing import Callable, Optional, Tuple, List
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
 from app.models import Report, FilingSubmission, AuditLog, User
 from app.config import get_settings
+from app.services.email_service import (
+    get_filing_submitted_email,
+    get_filing_accepted_email,
+    get_filing_rejected_email,
+    get_filing_needs_review_email,
+    send_rendered_many,
+)
 from app.services.notifications import log_notification
 
 logger = logging.getLogger(__name__)
@@ -40,6 +48,21 @@ def _get_company_admin(db: Session, company_id: Optional[UUID]) -> Optional[User
     ).first()
 
 
+def _filing_event_key(report: Report, status: str, *details: Optional[str]) -> str:
+    """
+    Idempotency key for one filing event's notifications.
+    
+    Names the filing attempt, the status and what the event reported
+    (receipt id, rejection code and message, review reason), so a repeat
+    of the same outcome is sent once while a re-filed report, or a second
+    rejection with a different error, still gets its emails. Repeats are
+    only caught within one process (see send_email()).
+    """
+    attempt = report.filing_submission.attempts if report.filing_submission else 0
+    digest = hashlib.sha256("\x1f".join(d or "" for d in details).encode("utf-8")).hexdigest()[:16]
+    return f"filing:{report.id}:{attempt}:{status}:{digest}"
+
+
 async def send_filing_notifications(
     db: Session,
     report: Report,
@@ -61,33 +84,29 @@ async def send_filing_notifications(
         rejection_message: Error message for rejected filings
         reason: Reason for needs_review status
     """
-    from app.services.email_service import (
-        send_filing_submitted_notification,
-        send_filing_accepted_notification,
-        send_filing_rejected_notification,
-        send_filing_needs_review_notification,
-        send_party_submitted_notification,
-        FRONTEND_URL,
-    )
-    
     config = report.notification_config or {}
     property_address = _get_property_address(report)
     
     # Build report URL
-    report_url = f"{FRONTEND_URL}/app/reports/{report.id}"
-    admin_report_url = f"{FRONTEND_URL}/app/admin/reports/{report.id}"
+    report_url = f"{settings.FRONTEND_URL}/app/reports/{report.id}"
+    admin_report_url = f"{settings.FRONTEND_URL}/app/admin/reports/{report.id}"
+    
+    # (to_email, renderer) per recipient — rendered and sent concurrently below
+    outgoing: List[Tuple[str, Callable[[], Tuple[str, str]]]] = []
     
     # All filing notifications are officer/staff-facing → use FinClear branding (no R2 logo needed)
     try:
         if status == "submitted":
+            submitted_at_str = datetime.utcnow().strftime('%B %d, %Y at %I:%M %p')
+            
             # Notify initiator
             if config.get("notify_initiator", True) and report.initiated_by:
-                send_filing_submitted_notification(
-                    to_email=report.initiated_by.email,
+                outgoing.append((report.initiated_by.email, partial(get_filing_submitted_email,
                     recipient_name=report.initiated_by.name,
                     property_address=property_address,
+                    submitted_at_str=submitted_at_str,
                     report_url=report_url,
-                )
+                )))
             
             # Log notification
             log_notification(
@@ -103,93 +122,93 @@ async def send_filing_notifications(
             
             # Notify initiator
             if config.get("notify_on_filing_complete", True) and report.initiated_by:
-                send_filing_accepted_notification(
-                    to_email=report.initiated_by.email,
+                outgoing.append((report.initiated_by.email, partial(get_filing_accepted_email,
                     recipient_name=report.initiated_by.name,
                     property_address=property_address,
                     bsa_id=receipt_id or "N/A",
                     filed_at_str=filed_at_str,
                     report_url=report_url,
-                )
+                )))
             
             # Notify company admin if different from initiator
             if config.get("notify_company_admin", True):
                 company_admin = _get_company_admin(db, report.company_id)
                 if company_admin and (not report.initiated_by_user_id or company_admin.id != report.initiated_by_user_id):
-                    send_filing_accepted_notification(
-                        to_email=company_admin.email,
+                    outgoing.append((company_admin.email, partial(get_filing_accepted_email,
                         recipient_name=company_admin.name,
                         property_address=property_address,
                         bsa_id=receipt_id or "N/A",
                         filed_at_str=filed_at_str,
                         report_url=report_url,
-                    )
+                    )))
             
             # Notify staff
             if config.get("notify_staff", True) and settings.STAFF_NOTIFICATION_EMAIL:
-                send_filing_accepted_notification(
-                    to_email=settings.STAFF_NOTIFICATION_EMAIL,
+                outgoing.append((settings.STAFF_NOTIFICATION_EMAIL, partial(get_filing_accepted_email,
                     recipient_name="Staff",
                     property_address=property_address,
                     bsa_id=receipt_id or "N/A",
                     filed_at_str=filed_at_str,
                     report_url=admin_report_url,
-                )
+                )))
         
         elif status == "rejected":
             # Notify initiator (urgent - they need to fix)
             if config.get("notify_on_filing_error", True) and report.initiated_by:
-                send_filing_rejected_notification(
-                    to_email=report.initiated_by.email,
+                outgoing.append((report.initiated_by.email, partial(get_filing_rejected_email,
                     recipient_name=report.initiated_by.name,
                     property_address=property_address,
                     rejection_code=rejection_code or "UNKNOWN",
                     rejection_message=rejection_message or "Filing was rejected",
                     report_url=report_url,
-                )
+                )))
             
             # Notify staff immediately
             if settings.STAFF_NOTIFICATION_EMAIL:
-                send_filing_rejected_notification(
-                    to_email=settings.STAFF_NOTIFICATION_EMAIL,
+                outgoing.append((settings.STAFF_NOTIFICATION_EMAIL, partial(get_filing_rejected_email,
                     recipient_name="Staff",
                     property_address=property_address,
                     rejection_code=rejection_code or "UNKNOWN",
                     rejection_message=rejection_message or "Filing was rejected",
                     report_url=admin_report_url,
-                )
+                )))
             
             # Notify admin
             if settings.ADMIN_NOTIFICATION_EMAIL:
-                send_filing_rejected_notification(
-                    to_email=settings.ADMIN_NOTIFICATION_EMAIL,
+                outgoing.append((settings.ADMIN_NOTIFICATION_EMAIL, partial(get_filing_rejected_email,
                     recipient_name="Admin",
                     property_address=property_address,
                     rejection_code=rejection_code or "UNKNOWN",
                     rejection_message=rejection_message or "Filing was rejected",
                     report_url=admin_report_url,
-                )
+                )))
         
         elif status == "needs_review":
             # Notify initiator
             if report.initiated_by:
-                send_filing_needs_review_notification(
-                    to_email=report.initiated_by.email,
+                outgoing.append((report.initiated_by.email, partial(get_filing_needs_review_email,
                     recipient_name=report.initiated_by.name,
                     property_address=property_address,
                     reason=reason or "Manual review required",
                     report_url=report_url,
-                )
+                )))
             
             # Notify staff
             if settings.STAFF_NOTIFICATION_EMAIL:
-                send_filing_needs_review_notification(
-                    to_email=settings.STAFF_NOTIFICATION_EMAIL,
+                outgoing.append((settings.STAFF_NOTIFICATION_EMAIL, partial(get_filing_needs_review_email,
                     recipient_name="Staff",
                     property_address=property_address,
                     reason=reason or "Manual review required",
                     report_url=admin_report_url,
-                )
+                )))
+        
+        # One concurrent fan-out instead of a blocking round-trip per recipient;
+        # bodies are only rendered if sending is enabled. Keyed per filing
+        # event: the auto-file, poll and retry paths can report the same
+        # outcome more than once.
+        await send_rendered_many(outgoing, idempotency_key=_filing_event_key(
+            report, status, receipt_id, rejection_code, rejection_message, reason,
+        ))
     
     except Exception as e:
         logger.error(f"Failed to send filing notification for report {report.id}: {e}")
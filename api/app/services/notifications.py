@@ -8,16 +8,17 @@ import logging
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from datetime import datetime
+from fastapi import BackgroundTasks
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
+from app.database import SessionLocal
 from app.models.notification_event import NotificationEvent
 from app.services.email_service import (
     send_party_invite,
+    send_party_invites_bulk,
     send_party_confirmation,
     EmailResult,
-    SENDGRID_ENABLED,
-    FRONTEND_URL,
 )
 
 logger = logging.getLogger(__name__)
@@ -86,17 +87,60 @@ def update_notification_delivery(
     ).first()
     
     if notification:
-        if result.success:
-            notification.delivery_status = "sent" if result.message_id != "disabled-mode" else "disabled"
-            notification.provider_message_id = result.message_id
-            notification.sent_at = datetime.utcnow()
-        else:
-            notification.delivery_status = "failed"
-            notification.error_message = result.error
-        
+        _apply_delivery_result(notification, result)
         db.flush()
 
 
+def _apply_delivery_result(notification: NotificationEvent, result: EmailResult) -> None:
+    """Copy a send result onto an outbox row."""
+    if result.success:
+        notification.delivery_status = "sent" if result.message_id != "disabled-mode" else "disabled"
+        notification.provider_message_id = result.message_id
+        notification.sent_at = datetime.utcnow()
+    else:
+        notification.delivery_status = "failed"
+        notification.error_message = result.error
+
+
+def deliver_party_invite(
+    notification_id: UUID,
+    to_email: str,
+    party_name: str,
+    party_role: str,
+    property_address: str,
+    portal_link: str,
+    company_name: Optional[str] = None,
+    company_logo_url: Optional[str] = None,
+) -> None:
+    """
+    Send a queued party invitation and record the result on its outbox row.
+    
+    Runs outside the request that created the notification, so it uses its
+    own database session. Keyed on the outbox row, so a re-run of the same
+    task doesn't send the invite twice.
+    """
+    result = send_party_invite(
+        to_email=to_email,
+        party_name=party_name,
+        party_role=party_role,
+        property_address=property_address,
+        portal_link=portal_link,
+        company_name=company_name,
+        company_logo_url=company_logo_url,
+        idempotency_key=f"notification:{notification_id}",
+    )
+    
+    db = SessionLocal()
+    try:
+        update_notification_delivery(db, notification_id, result)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to record delivery for notification {notification_id}: {e}")
+    finally:
+        db.close()
+
+
 def send_party_invite_notification(
     db: Session,
     report_id: UUID,
@@ -109,6 +153,7 @@ def send_party_invite_notification(
     portal_link: str,
     company_name: Optional[str] = None,
     company_logo_url: Optional[str] = None,
+    background_tasks: Optional[BackgroundTasks] = None,
 ) -> NotificationEvent:
     """
     Log and send party invitation email.
@@ -116,6 +161,9 @@ def send_party_invite_notification(
     1. Creates outbox record
     2. Sends email via SendGrid
     3. Updates delivery status
+    
+    When background_tasks is given, steps 2 and 3 are deferred until after
+    the response is sent and the outbox record stays "pending" until then.
     """
     # 1. Log to outbox first
     notification = log_notification(
@@ -135,6 +183,20 @@ def send_party_invite_notification(
         },
     )
     
+    if background_tasks is not None:
+        background_tasks.add_task(
+            deliver_party_invite,
+            notification.id,
+            to_email=to_email,
+            party_name=party_name,
+            party_role=party_role,
+            property_address=property_address,
+            portal_link=portal_link,
+            company_name=company_name,
+            company_logo_url=company_logo_url,
+        )
+        return notification
+    
     # 2. Send email
     result = send_party_invite(
         to_email=to_email,
@@ -152,6 +214,137 @@ def send_party_invite_notification(
     return notification
 
 
+def deliver_party_invites(
+    notification_ids: List[UUID],
+    invites: List[Dict[str, Any]],
+    property_address: str,
+    company_name: Optional[str] = None,
+    company_logo_url: Optional[str] = None,
+) -> None:
+    """
+    Send queued party invitations for one report in a single request and
+    record each result on its outbox row.
+    
+    Runs outside the request that created the notifications, so it uses its
+    own database session.
+    """
+    results = send_party_invites_bulk(
+        invites,
+        property_address=property_address,
+        company_name=company_name,
+        company_logo_url=company_logo_url,
+    )
+    
+    db = SessionLocal()
+    try:
+        for notification_id, result in zip(notification_ids, results):
+            update_notification_delivery(db, notification_id, result)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to record delivery for notifications {notification_ids}: {e}")
+    finally:
+        db.close()
+
+
+def send_party_invite_notifications(
+    db: Session,
+    report_id: UUID,
+    invites: List[Dict[str, Any]],
+    property_address: str,
+    company_name: Optional[str] = None,
+    company_logo_url: Optional[str] = None,
+    background_tasks: Optional[BackgroundTasks] = None,
+) -> List[NotificationEvent]:
+    """
+    Log and send invitations to every party on a report at once.
+    
+    Each invite is a dict with "party_id", "party_token", "to_email",
+    "party_name", "party_role" and "portal_link". One outbox record is
+    created per invite; the emails themselves go out through
+    send_party_invites_bulk() as a single SendGrid request.
+    
+    When background_tasks is given, sending is deferred as in
+    send_party_invite_notification().
+    """
+    if not invites:
+        return []
+    
+    # 1. Log to outbox first
+    notifications = [
+        log_notification(
+            db=db,
+            type="party_invite",
+            to_email=invite["to_email"],
+            subject="Action Required: Information Needed for Real Estate Transaction",
+            body_preview=f"Information request for {property_address}. Role: {invite['party_role']}",
+            report_id=report_id,
+            party_id=invite["party_id"],
+            party_token=invite["party_token"],
+            meta={
+                "party_name": invite["party_name"],
+                "party_role": invite["party_role"],
+                "property_address": property_address,
+                "portal_link": invite["portal_link"],
+            },
+        )
+        for invite in invites
+    ]
+    notification_ids = [n.id for n in notifications]
+    
+    if background_tasks is not None:
+        background_tasks.add_task(
+            deliver_party_invites,
+            notification_ids,
+            invites,
+            property_address=property_address,
+            company_name=company_name,
+            company_logo_url=company_logo_url,
+        )
+        return notifications
+    
+    # 2. Send emails
+    results = send_party_invites_bulk(
+        invites,
+        property_address=property_address,
+        company_name=company_name,
+        company_logo_url=company_logo_url,
+    )
+    
+    # 3. Update delivery status
+    for notification, result in zip(notifications, results):
+        _apply_delivery_result(notification, result)
+    db.flush()
+    
+    return notifications
+
+
+def deliver_party_confirmation(
+    notification_id: UUID,
+    to_email: str,
+    party_name: str,
+    confirmation_id: str,
+    property_address: str,
+) -> None:
+    """Send a queued submission confirmation and record the result on its outbox row."""
+    result = send_party_confirmation(
+        to_email=to_email,
+        party_name=party_name,
+        confirmation_id=confirmation_id,
+        property_address=property_address,
+    )
+    
+    db = SessionLocal()
+    try:
+        update_notification_delivery(db, notification_id, result)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to record delivery for notification {notification_id}: {e}")
+    finally:
+        db.close()
+
+
 def send_party_confirmation_notification(
     db: Session,
     report_id: UUID,
@@ -160,9 +353,13 @@ def send_party_confirmation_notification(
     party_name: str,
     confirmation_id: str,
     property_address: str,
+    background_tasks: Optional[BackgroundTasks] = None,
 ) -> NotificationEvent:
     """
     Log and send party submission confirmation email.
+    
+    As with invites, passing background_tasks defers the send until after
+    the response so the party's submit request doesn't wait on SendGrid.
     """
     # 1. Log to outbox
     notification = log_notification(
@@ -180,6 +377,17 @@ def send_party_confirmation_notification(
         },
     )
     
+    if background_tasks is not None:
+        background_tasks.add_task(
+            deliver_party_confirmation,
+            notification.id,
+            to_email=to_email,
+            party_name=party_name,
+            confirmation_id=confirmation_id,
+            property_address=property_address,
+        )
+        return notification
+    
     # 2. Send email
     result = send_party_confirmation(
         to_email=to_email,
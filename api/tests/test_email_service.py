@@ -0,0 +1,400 @@
+"""
+Tests for email rendering and sending.
+"""
+import asyncio
+import gzip
+import json
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.services.email_service import (
+    send_email,
+    send_email_async,
+    send_many,
+    send_party_submitted_notification,
+    send_party_invites_bulk,
+    get_party_invite_html,
+    get_party_invite_text,
+    get_confirmation_html,
+    get_confirmation_text,
+    get_invoice_email_html,
+    get_invoice_email_text,
+)
+
+
+# UTF-8 glyphs (📍 ⏰ ✓ → •) that were decoded as Mac Roman and saved back
+MOJIBAKE_SEQUENCES = ["üìç", "‚è∞", "‚úì", "‚Üí", "‚Ä¢"]
+
+
+def _rendered_templates():
+    return [
+        get_party_invite_html("Jane Buyer", "transferee", "123 Main St", "https://example.com/p/abc"),
+        get_party_invite_html("Jane Buyer", "transferee", "123 Main St", "https://example.com/p/abc",
+                              company_logo_url="https://example.com/logo.png"),
+        get_party_invite_text("Jane Buyer", "transferee", "123 Main St", "https://example.com/p/abc"),
+        get_confirmation_html("Jane Buyer", "CONF-1", "123 Main St"),
+        get_confirmation_text("Jane Buyer", "CONF-1", "123 Main St"),
+        get_invoice_email_html("Acme Title", "INV-1", 150.0, "Feb 1, 2026", "Jan 1, 2026",
+                               "Jan 31, 2026", "https://example.com/app/billing"),
+        get_invoice_email_text("Acme Title", "INV-1", 150.0, "Feb 1, 2026", "Jan 1, 2026",
+                               "Jan 31, 2026", "https://example.com/app/billing"),
+    ]
+
+
+class TestEmailTemplates:
+    """Rendered emails must not contain mis-decoded glyphs or raw user markup."""
+
+    @pytest.mark.parametrize("sequence", MOJIBAKE_SEQUENCES)
+    def test_no_mojibake(self, sequence):
+        for rendered in _rendered_templates():
+            assert sequence not in rendered
+
+    def test_user_fields_are_escaped(self):
+        html = get_party_invite_html("<b>Jane</b>", "transferee", "1 Main St & Co", "https://example.com/p/abc",
+                                     company_name="<i>Acme</i>")
+
+        assert "<b>Jane</b>" not in html
+        assert "&lt;b&gt;Jane&lt;/b&gt;" in html
+        assert "1 Main St &amp; Co" in html
+        assert "<strong>&lt;i&gt;Acme&lt;/i&gt;</strong>" in html
+
+
+@pytest.fixture
+def sendgrid_enabled():
+    """Enable sending against a stub SendGrid endpoint; yields the requests made."""
+    import httpx
+    from app.services import email_service
+
+    class Requests(list):
+        pass
+
+    requests_made = Requests()
+
+    def handler(request):
+        requests_made.append(request)
+        return httpx.Response(202, headers={"X-Message-Id": f"msg-{len(requests_made)}"})
+
+    settings = MagicMock(
+        SENDGRID_ENABLED=True,
+        SENDGRID_API_KEY="test-key",
+        SENDGRID_FROM_EMAIL="clear@fincenclear.com",
+        SENDGRID_FROM_NAME="FinClear",
+        SENDGRID_SANDBOX_MODE=False,
+        SENDGRID_PARTY_INVITE_TEMPLATE_ID="",
+        SENDGRID_MAX_CONCURRENCY=16,
+    )
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    # Each async fan-out opens (and closes) its own client; keep them for inspection
+    async_clients = []
+
+    def new_async_client(max_concurrent_sends):
+        async_clients.append(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        return async_clients[-1]
+
+    requests_made.async_clients = async_clients
+    email_service._sent_cache.clear()
+    with patch.object(email_service, "get_settings", return_value=settings), \
+         patch.object(email_service, "_get_http_client", return_value=client), \
+         patch.object(email_service, "_new_async_http_client", new_async_client):
+        yield requests_made
+    email_service._sent_cache.clear()
+
+
+def _payload(request):
+    """Decoded JSON body of a request made to the stub endpoint."""
+    content = request.content
+    if request.headers.get("Content-Encoding") == "gzip":
+        content = gzip.decompress(content)
+    return json.loads(content)
+
+
+class TestSendEmail:
+    """send_email behavior against a stubbed SendGrid API."""
+
+    def test_repeat_of_keyed_send_is_deduplicated(self, sendgrid_enabled):
+        first = send_email("jane@example.com", "Subject", "<p>Body</p>", idempotency_key="notification:1")
+        second = send_email("jane@example.com", "Subject", "<p>Body</p>", idempotency_key="notification:1")
+        other = send_email("jane@example.com", "Subject", "<p>Body</p>", idempotency_key="notification:2")
+
+        assert len(sendgrid_enabled) == 2
+        assert first.message_id == "msg-1"
+        assert second.success
+        assert second.message_id == "dedup-msg-1"
+        assert other.message_id == "msg-2"
+
+    @pytest.mark.parametrize("include_text", [True, False])
+    def test_filing_notifications_follow_include_plaintext_body(self, sendgrid_enabled, include_text):
+        from app.services import email_service, filing_lifecycle
+
+        email_service.get_settings().INCLUDE_PLAINTEXT_BODY = include_text
+        email_service.send_filing_accepted_notification(
+            "jane@example.com", "Jane", "123 Main St", "BSA-1", "Jan 1, 2026", "https://example.com/r/1",
+        )
+        report = MagicMock(id="report-1", notification_config={})
+        report.initiated_by.email, report.initiated_by.name = "officer@example.com", "Jane"
+        with patch.object(filing_lifecycle, "_get_company_admin", return_value=None):
+            asyncio.run(filing_lifecycle.send_filing_notifications(MagicMock(), report, "accepted", receipt_id="BSA-1"))
+
+        expected = ["text/plain", "text/html"] if include_text else ["text/html"]
+        assert [[part["type"] for part in _payload(r)["content"]] for r in sendgrid_enabled] == (
+            [expected] * len(sendgrid_enabled)
+        )
+
+    def test_filing_notifications_are_keyed_per_event(self, sendgrid_enabled):
+        from app.services import filing_lifecycle
+
+        report = MagicMock(id="report-1", notification_config={})
+        report.initiated_by.email, report.initiated_by.name = "officer@example.com", "Jane"
+        report.filing_submission.attempts = 1
+
+        def reject(code):
+            asyncio.run(filing_lifecycle.send_filing_notifications(
+                MagicMock(), report, "rejected", rejection_code=code, rejection_message="Filing was rejected",
+            ))
+
+        reject("BAD_FORMAT")
+        sent_per_event = len(sendgrid_enabled)
+        reject("BAD_FORMAT")
+        assert len(sendgrid_enabled) == sent_per_event
+
+        # A different rejection, or the same one on a re-filed attempt, is a new event
+        reject("MISSING_FIELD")
+        report.filing_submission.attempts = 2
+        reject("BAD_FORMAT")
+        assert len(sendgrid_enabled) == 3 * sent_per_event
+
+    def test_resend_within_dedup_window_is_sent(self, sendgrid_enabled):
+        from app.services.email_service import send_party_invite
+
+        # Staff resending an existing link produces a byte-identical email
+        results = [
+            send_party_invite("jane@example.com", "Jane Buyer", "transferee", "123 Main St", "https://example.com/p/abc")
+            for _ in range(2)
+        ]
+
+        assert len(sendgrid_enabled) == 2
+        assert [r.message_id for r in results] == ["msg-1", "msg-2"]
+
+    def test_payload_is_valid_json(self, sendgrid_enabled):
+        send_email("jane@example.com", "Subject ✓", "<p>Body</p>", "Body")
+
+        payload = _payload(sendgrid_enabled[0])
+        assert payload["personalizations"] == [{"to": [{"email": "jane@example.com"}]}]
+        assert payload["subject"] == "Subject ✓"
+        assert [c["type"] for c in payload["content"]] == ["text/plain", "text/html"]
+
+    def test_large_payload_is_gzipped(self, sendgrid_enabled):
+        send_email("jane@example.com", "Subject", "<p>" + "Body " * 1000 + "</p>")
+        send_email("jane@example.com", "Subject", "<p>Short</p>")
+
+        large, small = sendgrid_enabled
+        assert large.headers["Content-Encoding"] == "gzip"
+        assert "Content-Encoding" not in small.headers
+        assert _payload(large)["content"][-1]["value"].startswith("<p>Body")
+
+    def test_different_body_is_sent(self, sendgrid_enabled):
+        send_email("jane@example.com", "Subject", "<p>Body</p>")
+        send_email("jane@example.com", "Subject", "<p>Other body</p>")
+
+        assert len(sendgrid_enabled) == 2
+
+    @pytest.mark.parametrize("address", [
+        "", "@", "jane@", "@example.com", "jane@example", "jane doe@example.com",
+        "jane@example.com\n", "jane@example.com,bob@example.com",
+    ])
+    def test_invalid_address_is_rejected_without_api_call(self, sendgrid_enabled, address):
+        result = send_email(address, "Subject", "<p>Body</p>")
+
+        assert not result.success
+        assert result.error == "Invalid email address"
+        assert sendgrid_enabled == []
+
+    def test_every_entry_point_checks_the_api_key(self, sendgrid_enabled):
+        from app.services import email_service
+        from app.services.email_service import send_email_bulk, send_template_email
+
+        email_service.get_settings().SENDGRID_API_KEY = ""
+        results = [
+            send_email("jane@example.com", "Subject", "<p>Body</p>"),
+            send_template_email("jane@example.com", "d-invite", {}),
+            *send_email_bulk([{"email": "jane@example.com"}, {"email": "bob@example.com"}], "Subject", "<p>Body</p>"),
+        ]
+
+        assert all(r.error == "API key not configured" for r in results)
+        assert sendgrid_enabled == []
+
+    def test_async_sends_overlap(self, sendgrid_enabled):
+        async def send_all():
+            return await asyncio.gather(*(
+                send_email_async(f"party{i}@example.com", "Subject", "<p>Body</p>")
+                for i in range(3)
+            ))
+
+        results = asyncio.run(send_all())
+
+        assert len(sendgrid_enabled) == 3
+        assert all(r.success for r in results)
+
+    def test_send_many_sends_each_message(self, sendgrid_enabled):
+        messages = [(f"party{i}@example.com", "Subject", f"<p>Body {i}</p>") for i in range(5)]
+
+        results = asyncio.run(send_many(messages))
+
+        sent_to = [_payload(r)["personalizations"][0]["to"][0]["email"] for r in sendgrid_enabled]
+        assert sorted(sent_to) == [m[0] for m in messages]
+        assert len(results) == 5 and all(r.success for r in results)
+
+    def test_concurrency_cap_is_read_from_current_settings(self, sendgrid_enabled):
+        from app.services import email_service
+
+        email_service.get_settings().SENDGRID_MAX_CONCURRENCY = 2
+
+        async def session():
+            async with email_service._async_send_session() as session:
+                return session
+
+        assert asyncio.run(session()).semaphore._value == 2
+
+    def test_rate_limit_is_shared_after_the_burst(self):
+        from app.services.email_service import _RateLimiter
+
+        limiter = _RateLimiter(rate=4)
+        waits = [limiter.reserve() for _ in range(6)]
+
+        assert waits[:4] == [0.0] * 4
+        assert waits[4] == pytest.approx(0.25, abs=0.01)
+        assert waits[5] == pytest.approx(0.5, abs=0.01)
+
+    def test_each_event_loop_closes_its_async_client(self, sendgrid_enabled):
+        # What the sync filing paths do: one asyncio.run() per event
+        for i in range(3):
+            asyncio.run(send_many([(f"party{j}@example.com", "Subject", f"<p>Body {i}</p>") for j in range(2)]))
+
+        assert len(sendgrid_enabled) == 6
+        assert len(sendgrid_enabled.async_clients) == 3
+        assert all(client.is_closed for client in sendgrid_enabled.async_clients)
+
+    def test_party_nudges_for_one_report_share_a_request(self, sendgrid_enabled):
+        from app.services.email_service import send_party_nudges_bulk
+
+        results = send_party_nudges_bulk([
+            {"to_email": f"party{i}@example.com", "party_name": f"Party {i}", "party_role": "transferor",
+             "portal_url": f"https://example.com/p/{i}"}
+            for i in range(2)
+        ], "123 Main St")
+
+        assert len(sendgrid_enabled) == 1
+        payload = _payload(sendgrid_enabled[0])
+        assert [p["substitutions"]["-Link-"] for p in payload["personalizations"]] == [
+            "https://example.com/p/0", "https://example.com/p/1",
+        ]
+        assert "-Link-" in payload["content"][-1]["value"]
+        text = payload["content"][0]["value"]
+        assert "-LinkText-" in text and "-Link-" not in text
+        assert [p["substitutions"]["-LinkText-"] for p in payload["personalizations"]] == [
+            "https://example.com/p/0", "https://example.com/p/1",
+        ]
+        assert len(results) == 2 and all(r.success for r in results)
+
+    def test_invalid_address_skips_rendering(self, sendgrid_enabled):
+        from app.services import email_service
+
+        with patch.object(email_service, "_filing_email") as render:
+            result = email_service.send_filing_accepted_notification(
+                "not-an-address", "Jane", "123 Main St", "BSA-1", "Jan 1, 2026", "https://example.com/r/1",
+            )
+
+        assert result.error == "Invalid email address"
+        render.assert_not_called()
+        assert sendgrid_enabled == []
+
+    @pytest.mark.parametrize("headers, expected", [
+        ({}, 0.6),
+        ({"Retry-After": "5"}, 5.0),
+        ({"Retry-After": "3600"}, 30.0),
+        ({"Retry-After": "soon"}, 0.6),
+    ])
+    def test_retry_delay_honors_retry_after(self, headers, expected):
+        import httpx
+        from app.services.email_service import _retry_delay
+
+        assert _retry_delay(httpx.Response(429, headers=headers), attempt=1) == pytest.approx(expected)
+
+    def test_party_submitted_goes_out_as_one_request(self, sendgrid_enabled):
+        results = send_party_submitted_notification(
+            ["officer@example.com", "staff@example.com"],
+            "Jane Buyer", "transferee", "123 Main St", "report-1", all_complete=True,
+        )
+
+        assert len(sendgrid_enabled) == 1
+        payload = _payload(sendgrid_enabled[0])
+        assert [p["to"][0]["email"] for p in payload["personalizations"]] == ["officer@example.com", "staff@example.com"]
+        assert [r.message_id for r in results] == ["msg-1", "msg-1"]
+
+    def test_party_invites_go_out_as_one_request(self, sendgrid_enabled):
+        results = send_party_invites_bulk([
+            {"to_email": "buyer@example.com", "party_name": "<b>Jane</b>", "party_role": "transferee",
+             "portal_link": "https://example.com/p/abc"},
+            {"to_email": "seller@example.com", "party_name": "Bob & Co", "party_role": "transferor",
+             "portal_link": "https://example.com/p/def"},
+        ], "123 Main St")
+
+        assert len(sendgrid_enabled) == 1
+        payload = _payload(sendgrid_enabled[0])
+        text, html_part = (part["value"] for part in payload["content"])
+        assert "-GreetingText-" in text and "-Greeting-" not in text
+        assert "-Greeting-" in html_part
+        greetings = [p["substitutions"]["-GreetingText-"] for p in payload["personalizations"]]
+        assert greetings == ["<b>Jane</b>", "Bob & Co"]
+        assert payload["personalizations"][0]["substitutions"]["-Greeting-"] == "&lt;b&gt;Jane&lt;/b&gt;"
+        assert all(r.success for r in results)
+
+    def test_party_invites_use_one_dynamic_template_request(self, sendgrid_enabled):
+        from app.services import email_service
+
+        email_service.get_settings().SENDGRID_PARTY_INVITE_TEMPLATE_ID = "d-invite"
+        send_party_invites_bulk([
+            {"to_email": f"party{i}@example.com", "party_name": f"Party {i}", "party_role": "transferee",
+             "portal_link": f"https://example.com/p/{i}"}
+            for i in range(2)
+        ], "123 Main St")
+
+        assert len(sendgrid_enabled) == 1
+        payload = _payload(sendgrid_enabled[0])
+        assert payload["template_id"] == "d-invite"
+        assert [p["dynamic_template_data"]["portal_link"] for p in payload["personalizations"]] == [
+            "https://example.com/p/0", "https://example.com/p/1",
+        ]
+
+
+class TestDisabledMode:
+    """With sending disabled, notifications return before rendering anything."""
+
+    def test_filing_notification_skips_rendering(self):
+        from app.services import email_service
+
+        settings = MagicMock(SENDGRID_ENABLED=False, LOG_EMAIL_PREVIEW=False)
+        with patch.object(email_service, "get_settings", return_value=settings), \
+             patch.object(email_service, "_filing_email") as render:
+            result = email_service.send_filing_accepted_notification(
+                "jane@example.com", "Jane", "123 Main St", "BSA-1", "Jan 1, 2026", "https://example.com/r/1",
+            )
+
+        assert result.message_id == "disabled-mode"
+        render.assert_not_called()
+
+    def test_filing_lifecycle_notifications_skip_rendering(self):
+        from app.services import email_service, filing_lifecycle
+
+        settings = MagicMock(SENDGRID_ENABLED=False, LOG_EMAIL_PREVIEW=False)
+        report = MagicMock(notification_config={}, initiated_by_user_id=None)
+        with patch.object(email_service, "get_settings", return_value=settings), \
+             patch.object(filing_lifecycle, "_get_company_admin", return_value=None), \
+             patch.object(filing_lifecycle, "get_filing_accepted_email") as accepted, \
+             patch.object(filing_lifecycle, "get_filing_rejected_email") as rejected:
+            asyncio.run(filing_lifecycle.send_filing_notifications(MagicMock(), report, "accepted", receipt_id="BSA-1"))
+            asyncio.run(filing_lifecycle.send_filing_notifications(MagicMock(), report, "rejected"))
+
+        accepted.assert_not_called()
+        rejected.assert_not_called()
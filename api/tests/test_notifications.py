@@ -214,3 +214,40 @@ class TestNotificationService:
         # List with limit
         limited = list_notifications(db_session, limit=5)
         assert len(limited) == 5
+
+    def test_party_invite_notifications_share_one_send(self, db_session):
+        """Each invite gets its own outbox row; the emails go out in one call."""
+        import uuid
+        from app.services.email_service import EmailResult
+        from app.services.notifications import send_party_invite_notifications
+        
+        invites = [
+            {"party_id": uuid.uuid4(), "party_token": f"token-{i}", "to_email": f"party{i}@example.com",
+             "party_name": f"Party {i}", "party_role": "transferee", "portal_link": f"https://example.com/p/{i}"}
+            for i in range(3)
+        ]
+        results = [EmailResult(success=True, message_id="msg-1")] * 3
+        
+        with patch("app.services.notifications.send_party_invites_bulk", return_value=results) as bulk:
+            notifications = send_party_invite_notifications(db_session, None, invites, "123 Main St")
+        db_session.commit()
+        
+        bulk.assert_called_once()
+        assert [n.to_email for n in notifications] == [i["to_email"] for i in invites]
+        assert all(n.delivery_status == "sent" and n.provider_message_id == "msg-1" for n in notifications)
+
+    def test_party_confirmation_is_deferred_with_background_tasks(self, db_session):
+        """With background_tasks the outbox row is logged now and the send is queued."""
+        from fastapi import BackgroundTasks
+        from app.services.notifications import deliver_party_confirmation, send_party_confirmation_notification
+        
+        background_tasks = BackgroundTasks()
+        with patch("app.services.notifications.send_party_confirmation") as send:
+            notification = send_party_confirmation_notification(
+                db_session, None, None, "jane@example.com", "Jane", "PCT-2026-ABCDE", "123 Main St",
+                background_tasks=background_tasks,
+            )
+        
+        send.assert_not_called()
+        assert notification.delivery_status == "pending"
+        assert [t.func for t in background_tasks.tasks] == [deliver_party_confirmation]